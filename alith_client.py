@@ -2,27 +2,169 @@
 Alith AI client for trading decisions.
 """
 
-import json
+import asyncio
 import logging
-import os
+import re
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from alith import Agent
+import httpx
+import orjson
+from openai import AsyncOpenAI
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+PREAMBLE = """You are an expert crypto trader playing a PvP trading game called MortalCoin. 
+Your goal is to maximize profit and beat your opponent by making strategic trading decisions.
+
+You have access to real-time market data and game state information. You can:
+- Open long positions (betting price will go up)
+- Open short positions (betting price will go down)  
+- Close existing positions
+- Hold/wait for better opportunities
+
+Always consider:
+1. Market momentum and trends
+2. Risk/reward ratios
+3. Time remaining in the game
+4. Your current P&L vs opponent
+5. Optimal position sizing and timing
+
+Respond with clear, actionable trading decisions based on the provided data."""
+
+# Sent first and byte-identical on every request so provider-side prefix caching can apply;
+# never interpolate per-game data (ids, timestamps) into it
+_SYSTEM_MESSAGE = {"role": "system", "content": PREAMBLE}
+
+
+# Per-game data block with positional fields, filled from AlithClient._prompt_fields
+_GAME_SECTION_TMPL = """Current Market Data:
+- Current Price: ${:.2f}
+- Price Change: {:.2f}%
+- Recent Prices: {}
+
+Game State:
+- Time Remaining: {} seconds
+- Your P&L: ${:.2f}
+- Opponent P&L: ${:.2f}
+- P&L Difference: ${:.2f}
+- Opponent Has Position: {}
+
+Your Position:
+- Current Position: {}
+- Entry Price: {}
+- Current P&L %: {:.2f}%
+"""
+
+# Single-game trading prompt
+_PROMPT_TMPL = """You are an expert crypto trader playing a PvP trading game. Your goal is to maximize profit and beat your opponent.
+
+""" + _GAME_SECTION_TMPL + """
+Based on this information, what trading action should I take? Consider:
+1. Market momentum and trend
+2. Risk/reward ratio
+3. Time remaining in the game
+4. Current P&L vs opponent
+5. Whether to open a new position, close existing, or hold
+
+Respond with a JSON object containing:
+- "action": one of ["open_long", "open_short", "close_position", "hold"]
+- "reasoning": brief explanation of your decision
+- "confidence": confidence level from 0.0 to 1.0
+"""
+
+
+# Decision cache buckets: ticks whose price change rounds to the same step and whose
+# remaining time falls in the same window share a cached decision
+DECISION_CACHE_PRICE_CHANGE_STEP_PCT = 0.1
+DECISION_CACHE_TIME_BUCKET_SECONDS = 10
+
+
+def _sign(value: float) -> int:
+    """Return -1, 0 or 1."""
+    return (value > 0) - (value < 0)
+
+
+# Single-pass matcher for the plain-text fallback in AlithClient._parse_response
+_ACTION_RE = re.compile(r"open long|open short|close")
+_ACTION_BY_PHRASE = {
+    "open long": "open_long",
+    "open short": "open_short",
+    "close": "close_position",
+}
+
+
+def _find_json(text: str) -> Optional[str]:
+    """Return the outermost {...} block in text using a single bracket-depth scan.
+
+    Braces inside JSON string values (e.g. in "reasoning") are not counted.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+        elif ch == '"' and depth:
+            # Quotes only delimit strings once we are inside an object
+            in_string = True
+    return None
+
+
+def _compute_indicators(
+    current_price: float,
+    previous_price: Optional[float],
+    position: Optional[str],
+    entry_price: Optional[float],
+) -> tuple[float, float]:
+    """Return (price change %, open position P&L %) from plain scalars."""
+    # Calculate price trend
+    price_change = 0.0
+    if previous_price:
+        price_change = (current_price - previous_price) / previous_price * 100
+    
+    # Calculate current P&L if position is open
+    current_pnl_pct = 0.0
+    if position and entry_price:
+        if position == "long":
+            current_pnl_pct = (current_price - entry_price) / entry_price * 100
+        else:  # short
+            current_pnl_pct = (entry_price - current_price) / entry_price * 100
+    
+    return price_change, current_pnl_pct
+
+
+@dataclass(slots=True, frozen=True)
 class MarketData:
     """Market data for decision making."""
     current_price: float
     price_history: list[float]  # Recent price history
     timestamp: datetime
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
     
+    def __post_init__(self):
+        # Snapshot is immutable, so format the timestamp once
+        object.__setattr__(self, "timestamp_iso", self.timestamp.isoformat())
     
-@dataclass
+    
+@dataclass(slots=True, frozen=True)
 class GameState:
     """Current game state."""
     game_id: int
@@ -35,7 +177,7 @@ class GameState:
     my_position_entry_price: Optional[float] = None
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingDecision:
     """Trading decision from Alith AI."""
     action: str  # "open_long", "open_short", "close_position", "hold"
@@ -44,91 +186,185 @@ class TradingDecision:
 
 
 class AlithClient:
-    """Client for interacting with Alith AI."""
-    
-    def __init__(self, openai_api_key: str, model: str = "gpt-4"):
-        # Set OpenAI API key for Alith
-        os.environ["OPENAI_API_KEY"] = openai_api_key
-        
-        # Initialize Alith Agent
-        self.agent = Agent(
-            name="MortalCoin Trading Bot",
-            model=model,
-            preamble="""You are an expert crypto trader playing a PvP trading game called MortalCoin. 
-Your goal is to maximize profit and beat your opponent by making strategic trading decisions.
+    """Client for interacting with Alith AI.
 
-You have access to real-time market data and game state information. You can:
-- Open long positions (betting price will go up)
-- Open short positions (betting price will go down)  
-- Close existing positions
-- Hold/wait for better opportunities
-
-Always consider:
-1. Market momentum and trends
-2. Risk/reward ratios
-3. Time remaining in the game
-4. Your current P&L vs opponent
-5. Optimal position sizing and timing
-
-Respond with clear, actionable trading decisions based on the provided data.""",
+    Holds a pooled keep-alive HTTP connection to the LLM provider, so a single
+    instance should be shared process-wide and closed with ``aclose()``.
+    """
+    
+    def __init__(
+        self,
+        openai_api_key: str,
+        model: str = "gpt-4",
+        max_concurrent_requests: int = 8,
+        decision_cache_size: int = 256,
+        force_close_seconds: int = 5,
+        no_open_seconds: int = 10,
+    ):
+        self.model = model
+        
+        # Shared async client so concurrent games don't serialize on the LLM round-trip;
+        # the API key is scoped to this client rather than the process environment, and
+        # the semaphore caps in-flight requests to stay under provider rate limits
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            ),
         )
+        self.async_client = AsyncOpenAI(api_key=openai_api_key, http_client=self._http_client)
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
         
-    def get_trading_decision(
+        # LRU of bucketed decision inputs -> decision (see _decision_key); similar ticks
+        # skip the LLM round-trip
+        self._decision_cache: "OrderedDict[tuple, TradingDecision]" = OrderedDict()
+        self._decision_cache_size = decision_cache_size
+        
+        # Thresholds for forced moves that don't need the LLM
+        self.force_close_seconds = force_close_seconds
+        self.no_open_seconds = no_open_seconds
+        
+    async def get_trading_decision_async(
         self,
         market_data: MarketData,
         game_state: GameState,
     ) -> TradingDecision:
-        """Get trading decision from Alith AI."""
+        """Get trading decision from Alith AI without blocking the event loop."""
+        
+        forced = self._trivial_decision(game_state)
+        if forced is not None:
+            logger.info("Forced decision: %s (%s)", forced.action, forced.reasoning)
+            return forced
+        
+        # Context dict is only needed for debug output
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Decision context: %s", self._prepare_context(market_data, game_state))
         
-        # Prepare context for Alith AI
-        context = self._prepare_context(market_data, game_state)
+        cache_key = self._decision_key(market_data, game_state)
+        cached = self._decision_cache.get(cache_key)
+        if cached is not None:
+            self._decision_cache.move_to_end(cache_key)
+            logger.info("Alith AI decision (cached): %s (confidence: %s)", cached.action, cached.confidence)
+            return cached
         
         # Create prompt
-        prompt = self._create_trading_prompt(context)
+        prompt = self._create_trading_prompt(market_data, game_state)
         
         try:
-            # Use Alith Agent to get response
-            response = self.agent.prompt(prompt)
+            async with self._semaphore:
+                response = await self._stream_completion(prompt)
             
             # Parse response
             decision = self._parse_response(response)
+            self._remember_decision(cache_key, decision)
             
-            logger.info(f"Alith AI decision: {decision.action} (confidence: {decision.confidence})")
-            logger.debug(f"Reasoning: {decision.reasoning}")
+            logger.info("Alith AI decision: %s (confidence: %s)", decision.action, decision.confidence)
+            logger.debug("Reasoning: %s", decision.reasoning)
             
             return decision
             
         except Exception as e:
-            logger.error(f"Error getting Alith AI decision: {e}")
+            logger.error("Error getting Alith AI decision: %s", e)
             # Return a safe default decision
             return TradingDecision(
                 action="hold",
                 reasoning="Error in AI decision, holding position",
                 confidence=0.0
             )
-    
-    def _prepare_context(self, market_data: MarketData, game_state: GameState) -> Dict[str, Any]:
-        """Prepare context data for AI decision."""
         
-        # Calculate price trend
-        price_change = 0.0
-        if len(market_data.price_history) >= 2:
-            price_change = (market_data.current_price - market_data.price_history[-2]) / market_data.price_history[-2] * 100
+    def _trivial_decision(self, game_state: GameState) -> Optional[TradingDecision]:
+        """Return a decision for structurally forced moves, or None if the AI should decide."""
+        if game_state.my_position and game_state.time_remaining_seconds < self.force_close_seconds:
+            return TradingDecision(
+                action="close_position",
+                reasoning=f"Forced: less than {self.force_close_seconds}s remaining with an open position",
+                confidence=1.0
+            )
+        if not game_state.my_position and game_state.time_remaining_seconds < self.no_open_seconds:
+            return TradingDecision(
+                action="hold",
+                reasoning=f"Forced: less than {self.no_open_seconds}s remaining, too late to open a position",
+                confidence=1.0
+            )
+        return None
+        
+    async def _stream_completion(self, prompt: str) -> str:
+        """Stream the completion and stop reading as soon as the first JSON object is closed."""
+        stream = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            stream=True,
+        )
+        chunks: list[str] = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+                # Only rescan when an object could have just been closed
+                if "}" in delta:
+                    json_block = _find_json("".join(chunks))
+                    if json_block is not None:
+                        return json_block
+        finally:
+            # Aborts the HTTP response if we returned early
+            await stream.close()
+        return "".join(chunks)
         
-        # Calculate current P&L if position is open
-        current_pnl_pct = 0.0
-        if game_state.my_position and game_state.my_position_entry_price:
-            if game_state.my_position == "long":
-                current_pnl_pct = (market_data.current_price - game_state.my_position_entry_price) / game_state.my_position_entry_price * 100
-            else:  # short
-                current_pnl_pct = (game_state.my_position_entry_price - market_data.current_price) / game_state.my_position_entry_price * 100
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self.async_client.close()
+        
+    def _decision_key(self, market_data: MarketData, game_state: GameState) -> tuple:
+        """Cache key from the bucketed inputs a decision depends on.
+
+        Raw prices, P&L amounts and the exact time left change every tick, so
+        they are reduced to the rounded price change, a time window, our
+        position, and which way our position and the game are going.
+        """
+        price_change, current_pnl_pct = self._compute_metrics(market_data, game_state)
+        return (
+            round(price_change / DECISION_CACHE_PRICE_CHANGE_STEP_PCT),
+            game_state.time_remaining_seconds // DECISION_CACHE_TIME_BUCKET_SECONDS,
+            game_state.my_position,
+            _sign(current_pnl_pct),
+            _sign(game_state.my_pnl - game_state.opponent_pnl),
+            game_state.opponent_has_position,
+        )
+        
+    def _remember_decision(self, key: tuple, decision: TradingDecision) -> None:
+        """Store a decision in the LRU cache, evicting the oldest entry when full."""
+        if self._decision_cache_size <= 0:
+            return
+        self._decision_cache[key] = decision
+        self._decision_cache.move_to_end(key)
+        if len(self._decision_cache) > self._decision_cache_size:
+            self._decision_cache.popitem(last=False)
+        
+    def _compute_metrics(self, market_data: MarketData, game_state: GameState) -> tuple[float, float]:
+        """Compute price change % and current position P&L %."""
+        history = market_data.price_history
+        return _compute_indicators(
+            market_data.current_price,
+            history[-2] if len(history) >= 2 else None,
+            game_state.my_position,
+            game_state.my_position_entry_price,
+        )
+    
+    def _prepare_context(self, market_data: MarketData, game_state: GameState) -> Dict[str, Any]:
+        """Prepare context data for AI decision (used for debug logging)."""
+        price_change, current_pnl_pct = self._compute_metrics(market_data, game_state)
         
         return {
             "market": {
                 "current_price": market_data.current_price,
                 "price_history": market_data.price_history[-10:],  # Last 10 prices
                 "price_change_pct": price_change,
-                "timestamp": market_data.timestamp.isoformat(),
+                "timestamp": market_data.timestamp_iso,
             },
             "game": {
                 "game_id": game_state.game_id,
@@ -145,85 +381,62 @@ Respond with clear, actionable trading decisions based on the provided data.""",
             }
         }
     
-    def _create_trading_prompt(self, context: Dict[str, Any]) -> str:
-        """Create prompt for Alith AI."""
+    def _prompt_fields(self, market_data: MarketData, game_state: GameState) -> tuple:
+        """Positional values for _GAME_SECTION_TMPL."""
+        price_change, current_pnl_pct = self._compute_metrics(market_data, game_state)
+        entry_price = game_state.my_position_entry_price
         
-        prompt = f"""You are an expert crypto trader playing a PvP trading game. Your goal is to maximize profit and beat your opponent.
-
-Current Market Data:
-- Current Price: ${context['market']['current_price']:.2f}
-- Price Change: {context['market']['price_change_pct']:.2f}%
-- Recent Prices: {context['market']['price_history']}
-
-Game State:
-- Time Remaining: {context['game']['time_remaining_seconds']} seconds
-- Your P&L: ${context['game']['my_pnl']:.2f}
-- Opponent P&L: ${context['game']['opponent_pnl']:.2f}
-- P&L Difference: ${context['game']['pnl_difference']:.2f}
-- Opponent Has Position: {context['game']['opponent_has_position']}
-
-Your Position:
-- Current Position: {context['position']['current_position'] or 'None'}
-- Entry Price: {f"${context['position']['entry_price']:.2f}" if context['position']['entry_price'] else 'N/A'}
-- Current P&L %: {context['position']['current_pnl_pct']:.2f}%
-
-Based on this information, what trading action should I take? Consider:
-1. Market momentum and trend
-2. Risk/reward ratio
-3. Time remaining in the game
-4. Current P&L vs opponent
-5. Whether to open a new position, close existing, or hold
-
-Respond with a JSON object containing:
-- "action": one of ["open_long", "open_short", "close_position", "hold"]
-- "reasoning": brief explanation of your decision
-- "confidence": confidence level from 0.0 to 1.0
-"""
-        
-        return prompt
+        return (
+            market_data.current_price,
+            price_change,
+            # Six significant digits instead of the full 17-digit float repr per element
+            "[" + ", ".join(f"{p:.6g}" for p in market_data.price_history[-10:]) + "]",
+            game_state.time_remaining_seconds,
+            game_state.my_pnl,
+            game_state.opponent_pnl,
+            game_state.my_pnl - game_state.opponent_pnl,
+            game_state.opponent_has_position,
+            game_state.my_position or 'None',
+            f"${entry_price:.2f}" if entry_price else 'N/A',
+            current_pnl_pct,
+        )
+    
+    def _create_trading_prompt(self, market_data: MarketData, game_state: GameState) -> str:
+        """Create prompt for Alith AI."""
+        return _PROMPT_TMPL.format(*self._prompt_fields(market_data, game_state))
+    
+    def _decision_from_dict(self, decision_data: Dict[str, Any]) -> TradingDecision:
+        """Build a TradingDecision from a parsed JSON object."""
+        return TradingDecision(
+            action=decision_data.get("action", "hold"),
+            reasoning=decision_data.get("reasoning", "No reasoning provided"),
+            confidence=float(decision_data.get("confidence", 0.5))
+        )
     
-
     def _parse_response(self, response: str) -> TradingDecision:
         """Parse Alith AI response into TradingDecision."""
         
+        # The response is a direct string from the model
+        content = response or ""
+        
         try:
-            # The response is now a direct string from alith agent
-            content = response
+            # Look for the outermost JSON object in the response,
+            # otherwise try to parse the entire content as JSON
+            json_block = _find_json(content)
+            decision_data = orjson.loads(json_block if json_block is not None else content)
             
-            # Try to parse JSON from the content
-            # Look for JSON block in the response
-            import re
-            json_match = re.search(r'\{[^}]+\}', content, re.DOTALL)
-            
-            if json_match:
-                decision_data = json.loads(json_match.group())
-            else:
-                # Try to parse the entire content as JSON
-                decision_data = json.loads(content)
-            
-            return TradingDecision(
-                action=decision_data.get("action", "hold"),
-                reasoning=decision_data.get("reasoning", "No reasoning provided"),
-                confidence=float(decision_data.get("confidence", 0.5))
-            )
+            return self._decision_from_dict(decision_data)
             
         except Exception as e:
-            logger.error(f"Error parsing Alith response: {e}")
-            logger.debug(f"Raw response: {response}")
+            logger.error("Error parsing Alith response: %s", e)
+            logger.debug("Raw response: %s", response)
             
-            # Try to extract action from text
-            content_lower = content.lower()
-            if "open long" in content_lower:
-                action = "open_long"
-            elif "open short" in content_lower:
-                action = "open_short"
-            elif "close" in content_lower:
-                action = "close_position"
-            else:
-                action = "hold"
+            # Try to extract action from text (first phrase mentioned wins)
+            match = _ACTION_RE.search(content.lower())
+            action = _ACTION_BY_PHRASE[match.group()] if match else "hold"
             
             return TradingDecision(
                 action=action,
                 reasoning="Parsed from text response",
                 confidence=0.3
-            )
\ No newline at end of file
+            )
@@ -2,17 +2,86 @@
 Backend API client for MortalCoin.
 """
 
+import base64
 import logging
+import random
 import time
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 import aiohttp
 import asyncio
+import orjson
 from web3 import Web3
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
 logger = logging.getLogger(__name__)
 
+# Refresh the access token this many seconds before its JWT expiry
+TOKEN_REFRESH_SKEW_SECONDS = 60
+
+# Transient failures retried with jittered exponential backoff
+TRANSIENT_RETRY_ATTEMPTS = 3
+TRANSIENT_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# How long a fetched trading fight is reused before hitting the backend again
+FIGHT_CACHE_TTL_SECONDS = 5.0
+
+
+def _jwt_claims(token: Optional[str]) -> Dict[str, Any]:
+    """Decode a JWT's payload without verifying it; empty if it can't be read."""
+    if not token:
+        return {}
+    try:
+        payload = token.split(".")[1]
+        # JWT segments are base64url without padding
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return claims if isinstance(claims, dict) else {}
+    except Exception:
+        return {}
+
+
+def _json_dumps(obj: Any) -> str:
+    """orjson-backed serializer for aiohttp's ``json=`` request bodies."""
+    return orjson.dumps(obj).decode()
+
+
+async def _read_json_response(response: aiohttp.ClientResponse) -> tuple[str, Optional[Dict[str, Any]]]:
+    """Read a response body once and parse it with orjson if it is JSON.
+
+    The body is only decoded to text when it is needed for error reporting,
+    i.e. on error statuses or when it isn't parseable JSON; otherwise the
+    returned text is empty.
+    """
+    body = await response.read()
+    json_data: Optional[Dict[str, Any]] = None
+    if 'application/json' in response.headers.get('Content-Type', ''):
+        try:
+            json_data = orjson.loads(body)
+        except Exception:
+            json_data = None
+    if response.status >= 400 or json_data is None:
+        return body.decode('utf-8', 'replace'), json_data
+    return "", json_data
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session backed by a keep-alive connection pool.
+
+    Meant to be created once and shared by every HTTP user in the process.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=200,
+        limit_per_host=64,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        enable_cleanup_closed=True,
+        keepalive_timeout=90,
+    )
+    # Default timeouts so a slow endpoint can't hold a poll loop indefinitely
+    timeout = aiohttp.ClientTimeout(total=15, connect=3, sock_read=10)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, json_serialize=_json_dumps)
+
 
 class BackendClient:
     """Client for interacting with MortalCoin backend API."""
@@ -22,58 +91,132 @@ class BackendClient:
                  use_headless_auth: bool = True,
                  headless_message: str = "Login MortalCoin headless",
                  privy_user_id: Optional[str] = None,
-                 bot_private_key: Optional[str] = None):
+                 bot_private_key: Optional[str] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.api_url = api_url.rstrip('/')
+        # Endpoint URLs are fixed per client, so build them once
+        self._url_auth = f"{self.api_url}/api/v1/users/auth/"
+        self._url_auth_headless = f"{self.api_url}/api/v1/users/auth_headless/"
+        self._url_auth_refresh = f"{self.api_url}/api/v1/users/auth/refresh/"
+        self._url_me = f"{self.api_url}/api/v1/users/me/"
+        self._url_trading_fights = f"{self.api_url}/api/v1/games/trading-fights/"
+        self._url_sign_position = f"{self.api_url}/api/v1/games/trading-fights/sign-position/"
         self.bot_address = bot_address
         self.privy_key = privy_key
         self.use_headless_auth = use_headless_auth
         self.headless_message = headless_message
         self.privy_user_id = privy_user_id
         self.bot_private_key = bot_private_key
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Injected sessions are shared with other components and closed by their owner
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.auth_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         self.user_id: Optional[str] = None
+        self._token_exp: Optional[float] = None  # access token expiry (unix seconds)
+        self._auth_headers: Dict[str, str] = {}  # prebuilt Authorization header for auth_token
+        # Called with the new access token whenever a login or refresh issues one
+        self.on_token_issued: Optional[Callable[[str], None]] = None
+        # In-flight login/refresh shared by concurrent callers (single-flight)
+        self._auth_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._user_info_task: Optional[asyncio.Task] = None
+        # Short-lived trading fight cache: id -> (fetched_at monotonic, fight), plus in-flight fetches
+        self._fight_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._fight_tasks: Dict[str, asyncio.Task] = {}
+        # Validators and last body of the available-games poll for conditional GETs
+        self._games_etag: Optional[str] = None
+        self._games_last_modified: Optional[str] = None
+        self._games_cache: list[Dict[str, Any]] = []
+        self._games_cache_limit: Optional[int] = None
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
             
     async def _ensure_session(self):
-        """Ensure aiohttp session exists."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Ensure the pooled aiohttp session exists (created once, then reused)."""
+        if self.session is None or self.session.closed:
+            self.session = create_http_session()
+            self._owns_session = True
+
+    def _set_access_token(self, token: Optional[str]) -> None:
+        """Store the access token together with its expiry and user id claims."""
+        self.auth_token = token
+        claims = _jwt_claims(token)
+        exp = claims.get("exp")
+        self._token_exp = float(exp) if isinstance(exp, (int, float)) else None
+        # The token already names the user, which saves the /users/me/ round-trip
+        claim_user_id = claims.get("user_id")
+        if self.user_id is None and claim_user_id is not None:
+            self.user_id = str(claim_user_id)
+        self._auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if token and self.on_token_issued is not None:
+            self.on_token_issued(token)
 
-    async def _refresh_access_token(self) -> bool:
+    def _token_expiring(self, skew: float = TOKEN_REFRESH_SKEW_SECONDS) -> bool:
+        """Whether the current access token expires within ``skew`` seconds."""
+        return self._token_exp is not None and time.time() + skew > self._token_exp
+
+    async def ensure_valid_token(self, skew: float = TOKEN_REFRESH_SKEW_SECONDS) -> None:
+        """Make sure the access token stays valid for at least ``skew`` more seconds.
+
+        Logs in only when no token is held and refreshes only when it is about to expire,
+        so callers can use this on every tick without hitting the backend.
+        """
+        if self.auth_token is None:
+            await self._authenticate()
+            return
+        # Refresh ahead of expiry instead of paying a 401 -> refresh -> retry round-trip
+        if self._token_expiring(skew) and not await self._refresh_access_token(stale_token=self.auth_token):
+            if self._token_expiring(0):
+                # The refresh failed and the token is already dead; log in again
+                self._set_access_token(None)
+            await self._authenticate()
+
+    async def _refresh_access_token(self, stale_token: Optional[str] = None) -> bool:
+        """Refresh access token; concurrent callers share a single in-flight refresh.
+
+        If ``stale_token`` is given and another caller already replaced it, the
+        refresh is skipped.
+        """
+        if stale_token is not None and self.auth_token and self.auth_token != stale_token:
+            return True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh_access_token())
+        # Shield so one cancelled caller doesn't cancel the refresh for everyone
+        return await asyncio.shield(self._refresh_task)
+
+    async def _do_refresh_access_token(self) -> bool:
         """Refresh access token using stored refresh token."""
         if not self.refresh_token:
             logger.warning("No refresh token available for access token refresh")
             return False
         await self._ensure_session()
         try:
-            url = f"{self.api_url}/api/v1/users/auth/refresh/"
             headers = {"Authorization": f"Bearer {self.refresh_token}"}
-            async with self.session.post(url, headers=headers) as response:
-                text = await response.text()
+            async with self.session.post(self._url_auth_refresh, headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     new_access = data.get("access_token")
                     if new_access:
-                        self.auth_token = new_access
+                        self._set_access_token(new_access)
                         logger.info("\033[92m🔄 Access token refreshed\033[0m")
                         return True
                     logger.error("Refresh response missing access_token")
                     return False
                 else:
+                    text = await response.text()
                     logger.error(f"Failed to refresh access token: {response.status} - {text}")
                     # Invalidate access token to force full re-auth on next call
-                    self.auth_token = None
+                    self._set_access_token(None)
                     return False
         except Exception as e:
             logger.error(f"Error refreshing access token: {e}")
@@ -85,44 +228,77 @@ class BackendClient:
         url: str,
         *,
         require_auth: bool = True,
+        response_headers: Optional[Dict[str, str]] = None,
         **kwargs
     ) -> tuple[int, str, Optional[Dict[str, Any]]]:
-        """Perform an HTTP request with optional auth, auto-refresh and one retry.
+        """Perform an HTTP request with optional auth, auto-refresh and retries.
 
         Returns a tuple: (status_code, response_text, json_dict_or_None).
+        If ``response_headers`` is given, it is filled with the final response's headers.
         """
         await self._ensure_session()
-        headers = kwargs.pop("headers", {}) or {}
+        extra_headers = kwargs.pop("headers", None)
+        headers = extra_headers
+        used_token: Optional[str] = None
         if require_auth:
-            await self._authenticate()
-            headers["Authorization"] = f"Bearer {self.auth_token}"
+            await self.ensure_valid_token()
+            used_token = self.auth_token
+            # The cached dict is shared, so only copy it when merging extra headers
+            headers = {**self._auth_headers, **extra_headers} if extra_headers else self._auth_headers
 
+        status, resp_text, json_data = await self._send(method, url, headers, response_headers, **kwargs)
+        if status in (401, 403) and require_auth:
+            logger.info("Access token may be expired; attempting refresh and retry...")
+            if await self._refresh_access_token(stale_token=used_token):
+                headers = {**self._auth_headers, **extra_headers} if extra_headers else self._auth_headers
+                return await self._send(method, url, headers, response_headers, **kwargs)
+        return status, resp_text, json_data
+        
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        response_headers: Optional[Dict[str, str]],
+        **kwargs
+    ) -> tuple[int, str, Optional[Dict[str, Any]]]:
+        """Send one request, retrying transient failures with jittered backoff.
+
+        Idempotent methods are retried on 502/503/504, timeouts and client errors;
+        others only when the connection couldn't be established, since the server
+        may already have acted on them.
+        """
+        idempotent = method.upper() in _IDEMPOTENT_METHODS
+        retryable_errors = (aiohttp.ClientError, asyncio.TimeoutError) if idempotent else aiohttp.ClientConnectorError
+        for attempt in range(TRANSIENT_RETRY_ATTEMPTS - 1):
+            try:
+                result = await self._send_once(method, url, headers, response_headers, **kwargs)
+                if not (idempotent and result[0] in TRANSIENT_RETRY_STATUSES):
+                    return result
+                logger.warning("%s %s returned %s; retrying", method, url, result[0])
+            except retryable_errors as e:
+                logger.warning("%s %s failed (%r); retrying", method, url, e)
+            await asyncio.sleep(min(0.1 * 2 ** attempt, 2.0) + random.random() * 0.1)
+        return await self._send_once(method, url, headers, response_headers, **kwargs)
+        
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        response_headers: Optional[Dict[str, str]],
+        **kwargs
+    ) -> tuple[int, str, Optional[Dict[str, Any]]]:
+        """Send a single request and read its response."""
         async with self.session.request(method, url, headers=headers, **kwargs) as response:
-            resp_text = await response.text()
-            json_data: Optional[Dict[str, Any]] = None
-            content_type = response.headers.get('Content-Type', '')
-            if 'application/json' in content_type:
-                try:
-                    json_data = await response.json()
-                except Exception:
-                    json_data = None
-            status = response.status
-
-            if status in (401, 403) and require_auth:
-                logger.info("Access token may be expired; attempting refresh and retry...")
-                if await self._refresh_access_token():
-                    headers["Authorization"] = f"Bearer {self.auth_token}"
-                    async with self.session.request(method, url, headers=headers, **kwargs) as response2:
-                        resp_text2 = await response2.text()
-                        json_data2: Optional[Dict[str, Any]] = None
-                        content_type2 = response2.headers.get('Content-Type', '')
-                        if 'application/json' in content_type2:
-                            try:
-                                json_data2 = await response2.json()
-                            except Exception:
-                                json_data2 = None
-                        return response2.status, resp_text2, json_data2
-            return status, resp_text, json_data
+            if response_headers is not None:
+                response_headers.clear()
+                response_headers.update(response.headers)
+            if response.status == 304:
+                # Not modified: no body to read or parse
+                return 304, "", None
+            resp_text, json_data = await _read_json_response(response)
+            return response.status, resp_text, json_data
             
     async def _authenticate(self):
         """Authenticate with backend API.
@@ -131,7 +307,14 @@ class BackendClient:
         """
         if self.auth_token is not None:
             return
-            
+        
+        # Concurrent callers share one in-flight login
+        if self._auth_task is None or self._auth_task.done():
+            self._auth_task = asyncio.create_task(self._do_authenticate())
+        await asyncio.shield(self._auth_task)
+        
+    async def _do_authenticate(self):
+        """Perform the actual login request (see _authenticate)."""
         await self._ensure_session()
         
         try:
@@ -144,7 +327,7 @@ class BackendClient:
                 signed = Account.sign_message(eth_message, private_key=self.bot_private_key)
                 signature_hex = Web3.to_hex(signed.signature)
 
-                url = f"{self.api_url}/api/v1/users/auth_headless/"
+                url = self._url_auth_headless
                 payload: Dict[str, Any] = {
                     "address": self.bot_address,
                     "message": self.headless_message,
@@ -154,14 +337,14 @@ class BackendClient:
                     payload["privy_id"] = self.privy_user_id
 
                 async with self.session.post(url, json=payload) as response:
-                    response_text = await response.text()
                     logger.info(f"Auth(headless) API response: {response.status} - [payload hidden]")
                     if response.status == 200:
-                        result = await response.json()
-                        self.auth_token = result.get("access_token")
+                        result = orjson.loads(await response.read())
+                        self._set_access_token(result.get("access_token"))
                         self.refresh_token = result.get("refresh_token")
                         logger.info("\033[92m✅ Headless auth successful\033[0m")
                     else:
+                        response_text = await response.text()
                         logger.error(f"\033[31m❌ Headless auth failed: {response.status} - {response_text}\033[0m")
                         # Fallback to legacy auth if possible
                         if self.privy_key:
@@ -180,17 +363,17 @@ class BackendClient:
         if not self.privy_key:
             raise RuntimeError("Privy key not configured for legacy auth fallback")
         await self._ensure_session()
-        url = f"{self.api_url}/api/v1/users/auth/"
+        url = self._url_auth
         data = {"token": self.privy_key}
         async with self.session.post(url, json=data) as response:
-            response_text = await response.text()
             logger.info(f"Auth(legacy) API response: {response.status} - [token hidden]")
             if response.status == 200:
-                result = await response.json()
-                self.auth_token = result.get("access_token")
+                result = orjson.loads(await response.read())
+                self._set_access_token(result.get("access_token"))
                 self.refresh_token = result.get("refresh_token")
                 logger.info("\033[92m✅ Legacy auth successful\033[0m")
             else:
+                response_text = await response.text()
                 logger.error(f"\033[31m❌ Failed to authenticate (legacy): {response.status} - {response_text}\033[0m")
                 raise Exception(f"Authentication failed: {response.status}")
             
@@ -198,9 +381,16 @@ class BackendClient:
         """Get user information from backend API."""
         if self.user_id is not None:
             return
-            
+        
+        # Concurrent callers share one in-flight lookup
+        if self._user_info_task is None or self._user_info_task.done():
+            self._user_info_task = asyncio.create_task(self._do_get_user_info())
+        await asyncio.shield(self._user_info_task)
+        
+    async def _do_get_user_info(self):
+        """Perform the actual /users/me/ lookup (see _get_user_info)."""
         try:
-            url = f"{self.api_url}/api/v1/users/me/"
+            url = self._url_me
             # Try request; if unauthorized, attempt refresh and retry inside helper
             status, response_text, result = await self._request_with_retry(
                 "GET", url, require_auth=True
@@ -225,16 +415,18 @@ class BackendClient:
         coin_id: int
     ) -> Optional[Dict[str, Any]]:
         """Add opponent to fight using backend API (like frontend does)."""
-        await self._authenticate()
+        if self.auth_token is None:
+            await self._authenticate()
         
         try:
             # Use the endpoint that frontend uses to add opponent to fight
-            url = f"{self.api_url}/api/v1/games/trading-fights/{game_id}/add-opponent/"
+            self._fight_cache.pop(game_id, None)
+            url = f"{self._url_trading_fights}{game_id}/add-opponent/"
             
             data = {
                 "game_id": game_id,
                 "player2": player_address,
-                "timestamp": int(time.time()),
+                "timestamp": time.time_ns() // 1_000_000_000,
                 "ttl": 300,  # 5 minutes
                 "coin_id": coin_id
             }
@@ -242,7 +434,7 @@ class BackendClient:
             status, response_text, result = await self._request_with_retry(
                 "POST", url, json=data, require_auth=True
             )
-            logger.info(f"\033[96m📤 Add opponent API response: {status} - {response_text}\033[0m")
+            logger.info(f"\033[96m📤 Add opponent API response: {status}\033[0m")
             if status in (200, 204):
                 if status == 200 and isinstance(result, dict):
                     return result
@@ -257,15 +449,39 @@ class BackendClient:
             return None
             
     async def get_trading_fight(self, trading_fight_id: str) -> Optional[Dict[str, Any]]:
-        """Get trading fight by ID from backend API."""
+        """Get trading fight by ID from backend API.
+
+        Results are reused for FIGHT_CACHE_TTL_SECONDS and concurrent lookups of
+        the same fight share one request.
+        """
+        cached = self._fight_cache.get(trading_fight_id)
+        if cached is not None and time.monotonic() - cached[0] < FIGHT_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        task = self._fight_tasks.get(trading_fight_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_trading_fight(trading_fight_id))
+            self._fight_tasks[trading_fight_id] = task
+            task.add_done_callback(lambda _: self._fight_tasks.pop(trading_fight_id, None))
+        return await asyncio.shield(task)
+        
+    async def _fetch_trading_fight(self, trading_fight_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a trading fight and store it in the cache (see get_trading_fight)."""
         await self._ensure_session()
         
         try:
-            url = f"{self.api_url}/api/v1/games/trading-fights/{trading_fight_id}/"
+            url = f"{self._url_trading_fights}{trading_fight_id}/"
             status, response_text, result = await self._request_with_retry(
                 "GET", url, require_auth=False
             )
             if status == 200 and isinstance(result, dict):
+                now = time.monotonic()
+                # Drop expired entries so the cache stays bounded
+                self._fight_cache = {
+                    k: v for k, v in self._fight_cache.items()
+                    if now - v[0] < FIGHT_CACHE_TTL_SECONDS
+                }
+                self._fight_cache[trading_fight_id] = (now, result)
                 return result
             else:
                 logger.error(f"Failed to get trading fight: {status} - {response_text}")
@@ -288,10 +504,11 @@ class BackendClient:
         response is expected to include keys: "backend_signature" and
         "signed_message" where signed_message may include "hashedDirection".
         """
-        await self._authenticate()
+        if self.auth_token is None:
+            await self._authenticate()
 
         try:
-            url = f"{self.api_url}/api/v1/games/trading-fights/sign-position/"
+            url = self._url_sign_position
 
             data = {
                 "gameId": game_id,
@@ -304,47 +521,75 @@ class BackendClient:
             status, response_text, result = await self._request_with_retry(
                 "POST", url, json=data, require_auth=True
             )
-            logger.info(f"Position signature API response: {status} - {response_text}")
+            logger.info(f"Position signature API response: {status}")
             if status == 200 and isinstance(result, dict) and "backend_signature" in result:
                 return result
-            logger.error("Failed to get position signature (after retry if attempted)")
+            logger.error(
+                f"Failed to get position signature (after retry if attempted): {status} - {response_text}"
+            )
             return None
 
         except Exception as e:
             logger.error(f"Error getting position signature: {e}")
             return None
             
-    async def get_available_games(self) -> list[Dict[str, Any]]:
-        """Get list of available games to join."""
-        await self._authenticate()
-        await self._get_user_info()
+    async def get_available_games(self, limit: int = 50) -> list[Dict[str, Any]]:
+        """Get list of available games to join.
+
+        ``limit`` caps how many games the backend returns; callers that only
+        need the first few can ask for fewer instead of parsing the full page.
+        Uses conditional GETs, so an unchanged list comes back as a bodiless 304
+        and the previous result is returned.
+        """
+        if self.auth_token is None:
+            await self._authenticate()
+        if self.user_id is None:
+            await self._get_user_info()
         
         try:
             # Use the same endpoint as frontend: /api/v1/games/trading-fights/
             # with filters to get available games
-            url = f"{self.api_url}/api/v1/games/trading-fights/"
+            url = self._url_trading_fights
             
             params = {
                 "statuses": ["Not started"],  # Only games that haven't started
                 "exclude_user_created_fights": "true",  # Don't show our own fights
                 "user_id": self.user_id,  # Our user ID for filtering
                 "is_creator_online": "true",  # Only games where creator is online
-                "limit": 50,  # Get more games
+                "limit": limit,
                 "offset": 0
             }
             
+            headers: Dict[str, str] = {}
+            # Validators only apply to the page they were issued for
+            if self._games_cache_limit != limit:
+                self._games_etag = self._games_last_modified = None
+            if self._games_etag:
+                headers["If-None-Match"] = self._games_etag
+            if self._games_last_modified:
+                headers["If-Modified-Since"] = self._games_last_modified
+            response_headers: Dict[str, str] = {}
+            
             status, response_text, result = await self._request_with_retry(
-                "GET", url, params=params, require_auth=True
+                "GET", url, params=params, headers=headers, require_auth=True,
+                response_headers=response_headers
             )
-            logger.info(f"Backend API response: {status} - {response_text}")
+            if status == 304:
+                return self._games_cache
             if status == 200:
+                logger.debug("Backend API response: %s - %s", status, result)
                 if isinstance(result, dict) and "results" in result:
-                    return result["results"]
+                    games = result["results"]
                 elif isinstance(result, list):
-                    return result
+                    games = result
                 else:
                     logger.warning(f"Unexpected API response format: {result}")
                     return []
+                self._games_etag = response_headers.get("ETag")
+                self._games_last_modified = response_headers.get("Last-Modified")
+                self._games_cache = games
+                self._games_cache_limit = limit
+                return games
             else:
                 logger.error(f"Failed to get available games: {status} - {response_text}")
                 return []
@@ -368,9 +613,11 @@ class BackendClient:
 
     async def start_trading_fight(self, trading_fight_id: str) -> bool:
         """Notify backend to start the trading fight after successful joinGame."""
-        await self._authenticate()
+        if self.auth_token is None:
+            await self._authenticate()
         try:
-            url = f"{self.api_url}/api/v1/games/trading-fights/{trading_fight_id}/start-fight/"
+            self._fight_cache.pop(trading_fight_id, None)
+            url = f"{self._url_trading_fights}{trading_fight_id}/start-fight/"
             status, response_text, _ = await self._request_with_retry(
                 "POST", url, require_auth=True
             )
@@ -396,8 +643,8 @@ class BackendClient:
             if status == 200 and isinstance(result, dict):
                 return result
             else:
-                logger.debug(f"Failed to get price data from backend: {status} - {response_text}")
+                logger.debug("Failed to get price data from backend: %s - %s", status, response_text)
                 return None
         except Exception as e:
-            logger.debug(f"Error getting price data from backend: {e}")
+            logger.debug("Error getting price data from backend: %s", e)
             return None
@@ -7,9 +7,12 @@ from .game import (
     get_game_info,
     get_active_games,
     get_player_game_info,
+    get_games_batch,
+    get_game_and_player_info,
     Direction,
 )
-from .transactions import build_sign_send_transaction
+from .multicall import multicall_supported
+from .transactions import build_sign_send_transaction, build_sign_send_transaction_async
 
 __all__ = [
     "get_web3_connection",
@@ -17,6 +20,10 @@ __all__ = [
     "get_game_info",
     "get_active_games", 
     "get_player_game_info",
+    "get_games_batch",
+    "get_game_and_player_info",
     "Direction",
+    "multicall_supported",
     "build_sign_send_transaction",
+    "build_sign_send_transaction_async",
 ]
\ No newline at end of file
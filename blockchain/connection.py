@@ -2,11 +2,15 @@
 Web3 connection utilities.
 """
 
-import json
 import logging
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.contract import Contract
 try:
@@ -21,10 +25,42 @@ from uniswap_v2_abi import UNISWAP_V2_PAIR_ABI, ERC20_ABI
 
 logger = logging.getLogger(__name__)
 
+# Default ABI path relative to this file
+DEFAULT_ABI_PATH = Path(__file__).parent.parent / "contract_abi.json"
 
-def get_web3_connection(rpc_url: str) -> Web3:
-    """Create Web3 connection."""
-    web3 = Web3(Web3.HTTPProvider(rpc_url))
+
+# Timeout (seconds) applied to every JSON-RPC request
+RPC_TIMEOUT_SECONDS = 10
+
+
+# Keep-alive pool sizing: one pool per RPC host, enough sockets for the
+# concurrent to_thread reads and the transaction sender
+RPC_POOL_CONNECTIONS = 16
+RPC_POOL_MAXSIZE = 64
+
+
+@lru_cache(maxsize=8)
+def _rpc_session(rpc_url: str) -> requests.Session:
+    """Keep-alive requests session for ``rpc_url``, shared by every connection to it."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=RPC_POOL_CONNECTIONS, pool_maxsize=RPC_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_web3_connection(rpc_url: str, check_connection: bool = True) -> Web3:
+    """Create Web3 connection.
+
+    ``check_connection`` does a blocking RPC round-trip; async callers should
+    pass False and run ``web3.is_connected`` off the event loop themselves.
+    """
+    provider = Web3.HTTPProvider(
+        rpc_url,
+        request_kwargs={"timeout": RPC_TIMEOUT_SECONDS},
+        session=_rpc_session(rpc_url),
+    )
+    web3 = Web3(provider)
     
     # Add POA middleware if needed (for some networks like BSC)
     if geth_poa_middleware is not None:
@@ -33,26 +69,55 @@ def get_web3_connection(rpc_url: str) -> Web3:
         except Exception:
             pass
         
-    if not web3.is_connected():
-        raise ConnectionError(f"Failed to connect to {rpc_url}")
-        
-    logger.info(f"Connected to blockchain at {rpc_url}")
+    if check_connection:
+        if not web3.is_connected():
+            raise ConnectionError(f"Failed to connect to {rpc_url}")
+        logger.info(f"Connected to blockchain at {rpc_url}")
     return web3
 
 
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, memoizing the keccak for addresses we see repeatedly."""
+    return Web3.to_checksum_address(address)
+
+
+@lru_cache(maxsize=None)
+def _load_abi(abi_path: str) -> list[dict[str, Any]]:
+    """Read and parse an ABI file once; later calls for the same path hit the cache."""
+    with open(abi_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+# Contract classes per connection and ABI path. Both levels are weak: a contract
+# class references its Web3, so holding it strongly would keep the connection
+# (and its HTTP session) alive after it is replaced.
+_contract_factories: "weakref.WeakKeyDictionary[Web3, weakref.WeakValueDictionary[str, type[Contract]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _contract_factory(web3: Web3, abi_path: str) -> type[Contract]:
+    """Build the contract class for an ABI once per connection."""
+    factories = _contract_factories.get(web3)
+    if factories is None:
+        factories = _contract_factories.setdefault(web3, weakref.WeakValueDictionary())
+    factory = factories.get(abi_path)
+    if factory is None:
+        factory = web3.eth.contract(abi=_load_abi(abi_path))
+        factories[abi_path] = factory
+    return factory
+
+
+# Parse the bundled ABI at import so the first get_contract call does no disk I/O
+if DEFAULT_ABI_PATH.exists():
+    _load_abi(str(DEFAULT_ABI_PATH))
+
+
 def get_contract(web3: Web3, contract_address: str, abi_path: Optional[str] = None) -> Contract:
     """Get contract instance using ABI from file."""
-    if not abi_path:
-        # Default ABI path relative to this file
-        abi_path = Path(__file__).parent.parent / "contract_abi.json"
-    
-    with open(abi_path, "r") as f:
-        abi = json.load(f)
-        
-    contract = web3.eth.contract(
-        address=Web3.to_checksum_address(contract_address),
-        abi=abi
-    )
+    factory = _contract_factory(web3, str(abi_path or DEFAULT_ABI_PATH))
+    contract = factory(address=_checksum(contract_address))
     
     logger.info(f"Loaded contract at {contract_address}")
     return contract
@@ -61,7 +126,7 @@ def get_contract(web3: Web3, contract_address: str, abi_path: Optional[str] = No
 def get_uniswap_pair_contract(web3: Web3, pair_address: str) -> Contract:
     """Get Uniswap V2 pair contract instance."""
     contract = web3.eth.contract(
-        address=Web3.to_checksum_address(pair_address),
+        address=_checksum(pair_address),
         abi=UNISWAP_V2_PAIR_ABI
     )
     
@@ -72,7 +137,7 @@ def get_uniswap_pair_contract(web3: Web3, pair_address: str) -> Contract:
 def get_erc20_contract(web3: Web3, token_address: str) -> Contract:
     """Get ERC20 token contract instance."""
     contract = web3.eth.contract(
-        address=Web3.to_checksum_address(token_address),
+        address=_checksum(token_address),
         abi=ERC20_ABI
     )
     
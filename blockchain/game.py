@@ -3,11 +3,44 @@ Game-related blockchain functions.
 """
 
 from enum import IntEnum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
-from web3 import Web3
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
 from web3.contract import Contract
 
+from .connection import DEFAULT_ABI_PATH, _checksum, _load_abi
+from .multicall import aggregate3
+
+
+def _abi_type(param: Dict[str, Any]) -> str:
+    """Canonical eth_abi type string for an ABI parameter, expanding tuples."""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(c) for c in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+def _output_types(abi: List[Dict[str, Any]], name: str) -> List[str]:
+    """Output types of the view function ``name``, extracted from the ABI once."""
+    for entry in abi:
+        if entry.get("type") == "function" and entry.get("name") == name:
+            return [_abi_type(output) for output in entry["outputs"]]
+    raise KeyError(f"Function {name} not found in ABI")
+
+
+# Selectors and return types of the view functions, so reads can skip the
+# ContractFunction machinery and go straight to eth_call / Multicall3. The
+# output types come from the bundled ABI so they cannot drift from it.
+_GAMES_SELECTOR = function_signature_to_4byte_selector("games(uint256)")
+_ACTIVE_GAMES_SELECTOR = function_signature_to_4byte_selector("activeGames()")
+_PLAYER_GAME_INFO_SELECTOR = function_signature_to_4byte_selector("playerGameInfo(address)")
+_GAME_ABI = _load_abi(str(DEFAULT_ABI_PATH))
+_GAME_INFO_TYPES = _output_types(_GAME_ABI, "games")
+_ACTIVE_GAMES_TYPES = _output_types(_GAME_ABI, "activeGames")
+_PLAYER_GAME_INFO_TYPES = _output_types(_GAME_ABI, "playerGameInfo")
 
 class Direction(IntEnum):
     """Trading direction enum."""
@@ -15,26 +48,28 @@ class Direction(IntEnum):
     Short = 1
 
 
-def get_game_info(contract: Contract, game_id: int) -> Dict[str, Any]:
-    """Get game information from contract."""
-    game_info = contract.functions.games(game_id).call()
-    
+def _format_game_info(game_info: Sequence[Any]) -> Dict[str, Any]:
+    """Map a raw ``games(uint256)`` result tuple to a dict.
+
+    eth_abi decodes addresses lowercase, so they are checksummed to match what
+    ``ContractFunction.call()`` returns.
+    """
     return {
         "betAmount": game_info[0],
-        "player1": game_info[1],
+        "player1": _checksum(game_info[1]),
         "gameEndTimestamp": game_info[2],
-        "player1Pool": game_info[3],
-        "player2": game_info[4],
-        "player2Pool": game_info[5],
+        "player1Pool": _checksum(game_info[3]),
+        "player2": _checksum(game_info[4]),
+        "player2Pool": _checksum(game_info[5]),
         "state": game_info[6],
         "player1Position": {
             "openingPrice": game_info[7][0],
-            "hashedDirection": game_info[7][1].hex(),
+            "hashedDirection": "0x" + game_info[7][1].hex(),
             "state": game_info[7][2]
         },
         "player2Position": {
             "openingPrice": game_info[8][0],
-            "hashedDirection": game_info[8][1].hex(),
+            "hashedDirection": "0x" + game_info[8][1].hex(),
             "state": game_info[8][2]
         },
         "player1Pnl": game_info[9],
@@ -42,17 +77,73 @@ def get_game_info(contract: Contract, game_id: int) -> Dict[str, Any]:
     }
 
 
+def _format_player_game_info(info: Sequence[Any]) -> Dict[str, Any]:
+    """Map a raw ``playerGameInfo(address)`` result tuple to a dict."""
+    return {
+        "inGame": info[0],
+        "gameId": info[1],
+        "role": info[2]  # 0: None, 1: Creator, 2: Participant
+    }
+
+
+def _call(contract: Contract, calldata: bytes, output_types: List[str]) -> tuple:
+    """eth_call the contract with prebuilt calldata and decode the result."""
+    raw = contract.w3.eth.call({"to": contract.address, "data": calldata})
+    return decode(output_types, bytes(raw))
+
+
+def get_game_info(contract: Contract, game_id: int) -> Dict[str, Any]:
+    """Get game information from contract."""
+    return _format_game_info(
+        _call(contract, _GAMES_SELECTOR + encode(["uint256"], [game_id]), _GAME_INFO_TYPES)
+    )
+
+
 def get_active_games(contract: Contract) -> int:
     """Get number of active games."""
-    return contract.functions.activeGames().call()
+    return _call(contract, _ACTIVE_GAMES_SELECTOR, _ACTIVE_GAMES_TYPES)[0]
+
+
+@lru_cache(maxsize=256)
+def _player_game_info_calldata(player_address: str) -> bytes:
+    """Calldata for ``playerGameInfo(address)``; the monitor loop asks for the same address every tick."""
+    return _PLAYER_GAME_INFO_SELECTOR + encode(["address"], [_checksum(player_address)])
 
 
 def get_player_game_info(contract: Contract, player_address: str) -> Dict[str, Any]:
     """Get player's game information."""
-    info = contract.functions.playerGameInfo(Web3.to_checksum_address(player_address)).call()
-    
+    calldata = _player_game_info_calldata(player_address)
+    return _format_player_game_info(_call(contract, calldata, _PLAYER_GAME_INFO_TYPES))
+
+
+def get_games_batch(contract: Contract, game_ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """Get information for several games in a single RPC round-trip."""
+    calls = [(contract.address, _GAMES_SELECTOR + encode(["uint256"], [game_id])) for game_id in game_ids]
+    return [
+        _format_game_info(decode(_GAME_INFO_TYPES, data))
+        for _, data in aggregate3(contract.w3, calls)
+    ]
+
+
+def get_game_and_player_info(
+    contract: Contract,
+    game_id: int,
+    player_address: str,
+    extra_calls: Sequence[Tuple[str, bytes]] = (),
+) -> Dict[str, Any]:
+    """Get a game's info and a player's game info from the same block in one RPC round-trip.
+
+    ``extra_calls`` are further ``(target, calldata)`` reads to ride along in the
+    same batch; their raw returndata is returned under ``"extra"``, in order.
+    """
+    results = aggregate3(contract.w3, [
+        (contract.address, _GAMES_SELECTOR + encode(["uint256"], [game_id])),
+        (contract.address, _player_game_info_calldata(player_address)),
+        *extra_calls,
+    ])
+    (_, game_raw), (_, player_raw) = results[:2]
     return {
-        "inGame": info[0],
-        "gameId": info[1],
-        "role": info[2]  # 0: None, 1: Creator, 2: Participant
-    }
\ No newline at end of file
+        "game": _format_game_info(decode(_GAME_INFO_TYPES, game_raw)),
+        "player": _format_player_game_info(decode(_PLAYER_GAME_INFO_TYPES, player_raw)),
+        "extra": [data for _, data in results[2:]],
+    }
@@ -0,0 +1,61 @@
+"""
+Multicall3 helpers for batching contract reads into a single eth_call.
+"""
+
+import weakref
+from typing import List, Sequence, Tuple
+
+from eth_abi import decode, encode
+from web3 import Web3
+
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3((address,bool,bytes)[]) returns (bool,bytes)[]
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# Whether each connection's chain has Multicall3 deployed (learned on first call)
+_multicall_support: "weakref.WeakKeyDictionary[Web3, bool]" = weakref.WeakKeyDictionary()
+
+
+class MulticallUnavailable(Exception):
+    """Multicall3 is not deployed on the connection's chain."""
+
+
+def multicall_supported(web3: Web3) -> bool:
+    """Whether batched reads can go through Multicall3 on this connection.
+
+    True until a call finds no contract at MULTICALL3_ADDRESS; callers use it
+    to go straight to separate reads instead of retrying a doomed batch.
+    """
+    return _multicall_support.get(web3, True)
+
+
+def aggregate3(
+    web3: Web3,
+    calls: Sequence[Tuple[str, bytes]],
+    allow_failure: bool = False,
+) -> List[Tuple[bool, bytes]]:
+    """Execute ``(target, calldata)`` calls in one eth_call via Multicall3.
+
+    Returns ``(success, returndata)`` per call, in order. With ``allow_failure``
+    False the whole batch reverts if any call does. Raises MulticallUnavailable
+    if the chain has no Multicall3.
+    """
+    if not calls:
+        return []
+    if not multicall_supported(web3):
+        raise MulticallUnavailable(f"No Multicall3 at {MULTICALL3_ADDRESS}")
+    payload = encode(
+        ["(address,bool,bytes)[]"],
+        [[(target, allow_failure, calldata) for target, calldata in calls]],
+    )
+    raw = web3.eth.call({"to": MULTICALL3_ADDRESS, "data": _AGGREGATE3_SELECTOR + payload})
+    if not raw:
+        # A call to an address without code succeeds with empty returndata
+        _multicall_support[web3] = False
+        raise MulticallUnavailable(f"No Multicall3 at {MULTICALL3_ADDRESS}")
+    _multicall_support[web3] = True
+    (results,) = decode(["(bool,bytes)[]"], bytes(raw))
+    return list(results)
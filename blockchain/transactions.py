@@ -2,16 +2,255 @@
 Transaction utilities.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional
+import threading
 import time
+import weakref
 
 from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.types import TxParams, HexBytes
 
 
 logger = logging.getLogger(__name__)
 
+# Minimum fee increase for a replacement transaction (geth's default txpool
+# price bump); one extra wei is added on top to clear the threshold strictly
+DEFAULT_REPLACEMENT_BUMP = 0.10
+
+_FEE_FIELDS = ('maxFeePerGas', 'maxPriorityFeePerGas', 'gasPrice')
+
+# Receipt waiting: total timeout and how often to check for a new head
+RECEIPT_TIMEOUT_SECONDS = 120.0
+RECEIPT_POLL_SECONDS = 0.25
+
+# Receipt fields returned as hex quantities by eth_sendRawTransactionSync
+_RECEIPT_QUANTITY_FIELDS = (
+    "status", "gasUsed", "cumulativeGasUsed", "effectiveGasPrice", "blockNumber", "transactionIndex",
+)
+
+# Warms the fee oracle while the sender waits on eth_estimateGas
+_fee_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fee-prefetch")
+
+# Whether each connection's node supports eth_sendRawTransactionSync (learned on first send)
+_sync_send_support: "weakref.WeakKeyDictionary[Web3, bool]" = weakref.WeakKeyDictionary()
+
+
+class FeeOracle:
+    """Caches the latest base fee and gas price for a connection.
+
+    The base fee only changes once per block, so it is re-read only when the
+    cached value is older than ``ttl_seconds`` and the chain head has moved;
+    the cheap eth_blockNumber check avoids fetching a full block header for
+    every transaction.
+    """
+
+    def __init__(self, web3: Web3, ttl_seconds: float = 2.0):
+        self.web3 = web3
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._block_number: Optional[int] = None
+        self._base_fee: Optional[int] = None
+        self._base_fee_at = 0.0
+        self._gas_price: Optional[int] = None
+        self._gas_price_at = 0.0
+
+    def base_fee(self) -> int:
+        """Return the latest block's baseFeePerGas."""
+        with self._lock:
+            now = time.monotonic()
+            if self._base_fee is not None and now - self._base_fee_at < self.ttl_seconds:
+                return self._base_fee
+            block_number = self.web3.eth.block_number
+            if self._base_fee is None or block_number != self._block_number:
+                block = self.web3.eth.get_block(block_number)
+                self._base_fee = block['baseFeePerGas']
+                self._block_number = block_number
+            self._base_fee_at = now
+            return self._base_fee
+
+    def gas_price(self) -> int:
+        """Return the legacy gas price."""
+        with self._lock:
+            now = time.monotonic()
+            if self._gas_price is None or now - self._gas_price_at >= self.ttl_seconds:
+                self._gas_price = self.web3.eth.gas_price
+                self._gas_price_at = now
+            return self._gas_price
+
+
+_fee_oracles: "weakref.WeakKeyDictionary[Web3, FeeOracle]" = weakref.WeakKeyDictionary()
+
+
+def get_fee_oracle(web3: Web3) -> FeeOracle:
+    """Return the shared FeeOracle for a connection."""
+    oracle = _fee_oracles.get(web3)
+    if oracle is None:
+        # The oracle holds a proxy so the registry entry doesn't keep the connection alive
+        oracle = _fee_oracles.setdefault(web3, FeeOracle(weakref.proxy(web3)))
+    return oracle
+
+
+class NonceManager:
+    """Hands out nonces for one account from a local counter.
+
+    The counter is synced from the node's pending nonce on first use and again
+    only after reset(), so sends on the happy path need no nonce RPC.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self.web3 = web3
+        self.address = address
+        self._lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+
+    def allocate(self) -> int:
+        """Return the next nonce and advance the counter."""
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self.web3.eth.get_transaction_count(self.address, 'pending')
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def reset(self) -> None:
+        """Forget the local counter so the next allocation resyncs from the node."""
+        with self._lock:
+            self._next_nonce = None
+
+
+_nonce_managers: "weakref.WeakKeyDictionary[Web3, Dict[str, NonceManager]]" = weakref.WeakKeyDictionary()
+
+
+def get_nonce_manager(web3: Web3, address: str) -> NonceManager:
+    """Return the shared NonceManager for an account on a connection."""
+    managers = _nonce_managers.setdefault(web3, {})
+    manager = managers.get(address)
+    if manager is None:
+        # The manager holds a proxy so the registry entry doesn't keep the connection alive
+        manager = managers.setdefault(address, NonceManager(weakref.proxy(web3), address))
+    return manager
+
+
+def _rpc_error(exc: Exception) -> Optional[Dict[str, Any]]:
+    """Return the JSON-RPC error object carried by an exception, if any."""
+    details = exc.args[0] if exc.args else None
+    if isinstance(details, dict):
+        return details
+    response = getattr(exc, "rpc_response", None)
+    if isinstance(response, dict) and isinstance(response.get("error"), dict):
+        return response["error"]
+    return None
+
+
+def _is_method_unsupported(exc: Exception) -> bool:
+    """Whether an RPC error means the node doesn't implement the method."""
+    details = _rpc_error(exc)
+    if details is not None and details.get("code") == -32601:
+        return True
+    message = str(exc).lower()
+    return "method" in message and (
+        "not found" in message or "does not exist" in message or "not supported" in message
+    )
+
+
+def _is_send_rejection(exc: Exception) -> bool:
+    """Whether a failed send means the node refused the transaction.
+
+    Transport errors (read timeouts, dropped connections) and the node's own
+    sync-send timeout (code 4) can happen after the transaction entered the
+    mempool, so they are not rejections.
+    """
+    details = _rpc_error(exc)
+    if details is None:
+        return False
+    message = str(details.get("message", "")).lower()
+    return details.get("code") != 4 and "timeout" not in message and "timed out" not in message
+
+
+def _broadcast(
+    web3: Web3, raw_transaction: bytes, tx_hash: HexBytes
+) -> Tuple[HexBytes, Optional[Dict[str, Any]]]:
+    """Broadcast a signed transaction and return ``(tx_hash, receipt_or_None)``.
+
+    Uses eth_sendRawTransactionSync, which returns the receipt in the same RPC,
+    on nodes that support it; otherwise only sends and the receipt is None.
+    If a sync send fails without the node rejecting the transaction, it may
+    still be mined, so the receipt is None and the caller waits for it.
+    """
+    if _sync_send_support.get(web3, True):
+        try:
+            receipt = dict(web3.manager.request_blocking(
+                "eth_sendRawTransactionSync", ["0x" + bytes(raw_transaction).hex()]
+            ))
+            _sync_send_support[web3] = True
+            for key in _RECEIPT_QUANTITY_FIELDS:
+                if isinstance(receipt.get(key), str):
+                    receipt[key] = int(receipt[key], 16)
+            return HexBytes(receipt["transactionHash"]), receipt
+        except Exception as exc:  # noqa: BLE001
+            if not _is_method_unsupported(exc):
+                if _is_send_rejection(exc):
+                    raise
+                logger.warning(
+                    "eth_sendRawTransactionSync failed without a rejection (%s); waiting for %s",
+                    exc, tx_hash.hex(),
+                )
+                return tx_hash, None
+            logger.info("eth_sendRawTransactionSync not supported by node; using send + receipt polling")
+            _sync_send_support[web3] = False
+    return web3.eth.send_raw_transaction(raw_transaction), None
+
+
+def _find_receipt(web3: Web3, tx_hashes: List[HexBytes]) -> Optional[Dict[str, Any]]:
+    """Return the receipt of whichever hash has been mined, newest first."""
+    for tx_hash in reversed(tx_hashes):
+        try:
+            return web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            continue
+    return None
+
+
+def _wait_for_any_receipt(
+    web3: Web3,
+    tx_hashes: List[HexBytes],
+    address: str,
+    nonce: int,
+    timeout: float = RECEIPT_TIMEOUT_SECONDS,
+) -> Dict[str, Any]:
+    """Wait until any transaction sent at ``(address, nonce)`` is mined.
+
+    ``tx_hashes`` holds the original and every fee-bumped replacement, so a
+    replacement that wins is treated as success. Fails early if the nonce is
+    consumed by a transaction we don't know about.
+    """
+    deadline = time.monotonic() + timeout
+    last_block: Optional[int] = None
+    while True:
+        # Receipts can only appear with a new block, so poll the (tiny) head number
+        # and only look up receipts and the mined nonce once per block
+        block_number = web3.eth.block_number
+        if block_number != last_block:
+            last_block = block_number
+            receipt = _find_receipt(web3, tx_hashes)
+            if receipt is not None:
+                return receipt
+            if web3.eth.get_transaction_count(address, 'latest') > nonce:
+                # Re-check in case one of ours was mined between the two reads
+                receipt = _find_receipt(web3, tx_hashes)
+                if receipt is not None:
+                    return receipt
+                raise Exception(
+                    f"Nonce {nonce} was consumed by a transaction other than {[h.hex() for h in tx_hashes]}"
+                )
+        if time.monotonic() >= deadline:
+            raise TimeExhausted(f"Transactions {[h.hex() for h in tx_hashes]} not mined after {timeout} seconds")
+        time.sleep(RECEIPT_POLL_SECONDS)
+
 
 def estimate_gas_with_buffer(web3: Web3, transaction: TxParams, buffer_percent: int = 20) -> int:
     """Estimate gas with buffer."""
@@ -32,76 +271,99 @@ def build_sign_send_transaction(
     *,
     retries: int = 2,
     retry_sleep_seconds: float = 0.3,
-    fee_bump_factor: float = 1.15,
+    replacement_bump: float = DEFAULT_REPLACEMENT_BUMP,
 ) -> Tuple[str, Dict[str, Any]]:
     """Build, sign and send a transaction with basic nonce/fee retry logic.
 
-    - Detects 'nonce too low' and refreshes nonce using 'pending'.
+    - Takes nonces from a per-account NonceManager; on 'nonce too low'/'too high'
+      or any other failure it resyncs from the node's 'pending' nonce.
     - Handles 'already known' by waiting on the computed tx hash.
-    - Bumps fees on retries to satisfy replacement requirements.
+    - Replaces a transaction that isn't mined in time with a fee-bumped one at
+      the same nonce and waits on all of them, so whichever is mined counts.
+    - When replacing an underpriced transaction, raises each fee to the larger of
+      the current market fee and the replaced fee bumped by ``replacement_bump``
+      plus one wei, the minimum the node's txpool accepts.
     """
     if not tx_params:
         tx_params = {}
 
     account = web3.eth.account.from_key(private_key)
+    fee_oracle = get_fee_oracle(web3)
+    nonce_manager = get_nonce_manager(web3, account.address)
+    current_nonce: Optional[int] = None
+    # Fees of the last signed transaction at current_nonce (the one a retry replaces)
+    replaced_fees: Dict[str, int] = {}
+    # Every transaction broadcast at current_nonce; any of them being mined is success
+    sent_hashes: List[HexBytes] = []
 
-    def _apply_default_fees(tx: Dict[str, Any], attempt_index: int) -> None:
+    def _apply_default_fees(tx: Dict[str, Any]) -> None:
         # If both legacy and EIP-1559 are absent, set EIP-1559 params
         if 'gasPrice' not in tx and 'maxFeePerGas' not in tx:
             try:
-                base_fee = web3.eth.get_block('latest')['baseFeePerGas']
+                base_fee = fee_oracle.base_fee()
                 max_priority_fee = web3.to_wei(2, 'gwei')
                 tx['maxFeePerGas'] = base_fee * 2 + max_priority_fee
                 tx['maxPriorityFeePerGas'] = max_priority_fee
                 tx.pop('gasPrice', None)
             except Exception:
-                tx['gasPrice'] = web3.eth.gas_price
-        # On retries, bump whichever pricing scheme is present
-        if attempt_index > 0:
-            if 'maxFeePerGas' in tx and 'maxPriorityFeePerGas' in tx:
-                tx['maxPriorityFeePerGas'] = int(tx['maxPriorityFeePerGas'] * fee_bump_factor)
-                tx['maxFeePerGas'] = int(tx['maxFeePerGas'] * fee_bump_factor)
-            elif 'gasPrice' in tx:
-                tx['gasPrice'] = int(tx['gasPrice'] * fee_bump_factor)
+                tx['gasPrice'] = fee_oracle.gas_price()
+        # Replacements must beat the replaced fees by the txpool's price bump
+        for field in _FEE_FIELDS:
+            if field in tx and field in replaced_fees:
+                min_fee = int(replaced_fees[field] * (1 + replacement_bump)) + 1
+                tx[field] = max(tx[field], min_fee)
 
     last_error: Optional[Exception] = None
+    skeleton: Optional[Dict[str, Any]] = None
 
     for attempt in range(retries + 1):
+        signed_txn = None
         try:
-            # Always take latest pending nonce
-            current_nonce = web3.eth.get_transaction_count(account.address, 'pending')
-            # Build transaction skeleton
-            transaction: Dict[str, Any] = function_call.build_transaction({
-                'from': account.address,
-                'nonce': current_nonce,
-                'gas': tx_params.get('gas', None),
-                'gasPrice': tx_params.get('gasPrice', None),
-                'maxFeePerGas': tx_params.get('maxFeePerGas', None),
-                'maxPriorityFeePerGas': tx_params.get('maxPriorityFeePerGas', None),
-                'value': tx_params.get('value', 0),
-            })
-
-            # Remove None values
-            transaction = {k: v for k, v in transaction.items() if v is not None}
-
-            # Ensure gas
-            if 'gas' not in transaction:
-                transaction['gas'] = estimate_gas_with_buffer(web3, transaction)
-
-            # Ensure fees and bump on retries
-            _apply_default_fees(transaction, attempt)
+            # Build the skeleton (calldata, to, chainId, value, gas) once; retries
+            # only change the nonce and fees
+            if skeleton is None:
+                if not any(field in tx_params for field in _FEE_FIELDS):
+                    # Fetch the base fee alongside the gas estimate; _apply_default_fees then
+                    # waits on the oracle's lock and reads the cached value
+                    _fee_prefetch_executor.submit(fee_oracle.base_fee)
+                built = function_call.build_transaction({
+                    'from': account.address,
+                    'nonce': None,
+                    'gas': tx_params.get('gas', None),
+                    'gasPrice': tx_params.get('gasPrice', None),
+                    'maxFeePerGas': tx_params.get('maxFeePerGas', None),
+                    'maxPriorityFeePerGas': tx_params.get('maxPriorityFeePerGas', None),
+                    'value': tx_params.get('value', 0),
+                })
+                # Remove None values
+                built = {k: v for k, v in built.items() if v is not None}
+                # Ensure gas
+                if 'gas' not in built:
+                    built['gas'] = estimate_gas_with_buffer(web3, built)
+                skeleton = built
+            # Take the nonce only once building and gas estimation succeeded, so a revert
+            # there doesn't leave a gap that stalls later sends; fee-bump replacements
+            # keep the nonce of the transaction they replace
+            if current_nonce is None:
+                current_nonce = nonce_manager.allocate()
+            transaction: Dict[str, Any] = {**skeleton, 'nonce': current_nonce}
+
+            # Ensure fees and bump over a replaced transaction
+            _apply_default_fees(transaction)
 
             # Sign
             signed_txn = web3.eth.account.sign_transaction(transaction, private_key)
+            replaced_fees = {f: transaction[f] for f in _FEE_FIELDS if f in transaction}
 
-            # Broadcast
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-
-            # Wait for receipt
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+            # Broadcast and wait for whichever transaction at this nonce gets mined
+            tx_hash, receipt = _broadcast(web3, signed_txn.raw_transaction, HexBytes(signed_txn.hash))
+            sent_hashes.append(tx_hash)
+            if receipt is None:
+                receipt = _wait_for_any_receipt(web3, sent_hashes, account.address, current_nonce)
+            mined_hash = HexBytes(receipt['transactionHash'])
             if receipt['status'] != 1:
-                raise Exception(f"Transaction failed: {tx_hash.hex()}")
-            return tx_hash.hex(), receipt
+                raise Exception(f"Transaction failed: {mined_hash.hex()}")
+            return mined_hash.hex(), receipt
 
         except Exception as exc:  # noqa: BLE001
             last_error = exc
@@ -118,24 +380,42 @@ def build_sign_send_transaction(
                 message = str(exc).lower()
 
             # If tx is already known, wait for its hash
-            if 'already known' in message:
+            if 'already known' in message and signed_txn is not None:
                 try:
-                    # Compute hash and wait
-                    raw = signed_txn.raw_transaction  # type: ignore[name-defined]
-                    computed_hash = Web3.keccak(raw).hex()
-                    receipt = web3.eth.wait_for_transaction_receipt(computed_hash)
+                    # The signed transaction already carries its hash
+                    computed_hash = HexBytes(signed_txn.hash)
+                    if computed_hash not in sent_hashes:
+                        sent_hashes.append(computed_hash)
+                    receipt = _wait_for_any_receipt(web3, sent_hashes, account.address, current_nonce)
+                    mined_hash = HexBytes(receipt['transactionHash'])
                     if receipt['status'] != 1:
-                        raise Exception(f"Transaction failed: {computed_hash}")
-                    return computed_hash, receipt
+                        raise Exception(f"Transaction failed: {mined_hash.hex()}")
+                    return mined_hash.hex(), receipt
                 except Exception as wait_exc:  # noqa: BLE001
                     last_error = wait_exc
 
+            # A replacement rejected for 'nonce too low' usually means an earlier
+            # transaction at this nonce was just mined; don't send the call again
+            if 'nonce too low' in message and sent_hashes:
+                receipt = _find_receipt(web3, sent_hashes)
+                if receipt is not None:
+                    mined_hash = HexBytes(receipt['transactionHash'])
+                    if receipt['status'] != 1:
+                        nonce_manager.reset()
+                        raise Exception(f"Transaction failed: {mined_hash.hex()}")
+                    return mined_hash.hex(), receipt
+
             # Retryable nonce/price conditions
-            retryable = (
-                'nonce too low' in message
-                or 'replacement transaction underpriced' in message
-                or 'transaction underpriced' in message
-            )
+            underpriced = 'transaction underpriced' in message  # also matches 'replacement ...'
+            # A sent transaction that isn't mined in time is replaced with higher fees
+            stuck = isinstance(last_error, TimeExhausted)
+            retryable = underpriced or stuck or 'nonce too low' in message or 'nonce too high' in message
+            if not (underpriced or stuck):
+                # The local counter may be stale or the nonce may be unused; resync from the node
+                nonce_manager.reset()
+                current_nonce = None
+                replaced_fees = {}
+                sent_hashes = []
             if attempt < retries and retryable:
                 time.sleep(retry_sleep_seconds)
                 continue
@@ -143,5 +423,23 @@ def build_sign_send_transaction(
             # Non-retryable or retries exhausted
             break
 
-    # If we exit loop without returning
-    raise last_error if last_error else Exception('Unknown transaction error')
\ No newline at end of file
+    # If we exit loop without returning, the last nonce may be unused
+    nonce_manager.reset()
+    raise last_error if last_error else Exception('Unknown transaction error')
+
+
+async def build_sign_send_transaction_async(
+    web3: Web3,
+    function_call,
+    private_key: str,
+    tx_params: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> Tuple[str, Dict[str, Any]]:
+    """Run build_sign_send_transaction in a worker thread.
+
+    Its RPCs and receipt polling block, so async callers use this to keep the
+    event loop responsive while a transaction confirms.
+    """
+    return await asyncio.to_thread(
+        build_sign_send_transaction, web3, function_call, private_key, tx_params, **kwargs
+    )
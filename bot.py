@@ -62,6 +62,9 @@ class MortalCoinBot:
         # Stop game manager
         await self.game_manager.stop()
         
+        # Close pooled LLM connections
+        await self.alith_client.aclose()
+        
         logger.info("Bot stopped")
         
     def _handle_signal(self):
@@ -4,9 +4,14 @@ Configuration settings for MortalCoin Trading Bot.
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
+# Environment values accepted as "enabled" for boolean flags
+_TRUE_SET = frozenset({"1", "true", "yes", "on"})
+
+
 @dataclass
 class BotConfig:
     """Bot configuration settings."""
@@ -37,6 +42,8 @@ class BotConfig:
     
     # Monitoring settings
     monitor_interval_seconds: int = 5
+    max_concurrent_txs: int = 4  # Transactions the bot sends at once across all games
+    player_info_cache_ttl: float = 2.0  # Seconds a playerGameInfo read is reused between polls
     
     # Game joining settings
     game_search_interval_seconds: int = 10  # How often to search for available games to join
@@ -56,8 +63,13 @@ class BotConfig:
     privy_user_id: Optional[str] = None
     
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "BotConfig":
-        """Create config from environment variables."""
+        """Create config from environment variables.
+
+        The environment is read once per process and the same instance is
+        returned afterwards; call ``BotConfig.from_env.cache_clear()`` to re-read it.
+        """
         # Normalize private key to ensure it has 0x prefix
         private_key = os.environ["MORTALCOIN_BOT_PRIVATE_KEY"]
         if not private_key.startswith("0x"):
@@ -65,7 +77,7 @@ class BotConfig:
             
         # Determine auth mode
         headless_flag = os.getenv("MORTALCOIN_HEADLESS_AUTH", "1").strip().lower()
-        use_headless_auth = headless_flag in ("1", "true", "yes", "on")
+        use_headless_auth = headless_flag in _TRUE_SET
 
         # Optional Privy key for legacy flow or mapping
         privy_key = os.getenv("MORTALCOIN_PRIVY_KEY")
@@ -93,6 +105,8 @@ class BotConfig:
             position_hold_time_max=int(os.getenv("MORTALCOIN_POSITION_HOLD_MAX", "50")),
             game_duration_seconds=int(os.getenv("MORTALCOIN_GAME_DURATION", "60")),
             monitor_interval_seconds=int(os.getenv("MORTALCOIN_MONITOR_INTERVAL", "5")),
+            max_concurrent_txs=int(os.getenv("MORTALCOIN_MAX_CONCURRENT_TXS", "4")),
+            player_info_cache_ttl=float(os.getenv("MORTALCOIN_PLAYER_INFO_CACHE_TTL", "2.0")),
             game_search_interval_seconds=int(os.getenv("MORTALCOIN_GAME_SEARCH_INTERVAL", "10")),
             pool_coin_id=int(os.getenv("MORTALCOIN_POOL_COIN_ID", "1")),
             db_path=os.getenv("MORTALCOIN_DB_PATH", "mortalcoin_bot.db"),
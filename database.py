@@ -4,12 +4,46 @@ Database for storing game history and statistics.
 
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from dataclasses import dataclass, asdict
 
 
-@dataclass
+# Running totals kept in stats_summary, and the queries giving one game's /
+# position's contribution to them (also used to backfill the summary)
+_GAME_SUMMARY_COLUMNS = (
+    "total_games", "wins", "losses", "draws", "total_pnl", "total_duration_seconds", "timed_games",
+)
+_GAME_STATS_SQL = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN result = 'loss' THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN result = 'draw' THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(final_pnl), 0),
+        COALESCE(SUM((julianday(ended_at) - julianday(started_at)) * 86400), 0),
+        COUNT(ended_at)
+    FROM games
+    WHERE status = 'completed' AND {where}
+"""
+_POSITION_SUMMARY_COLUMNS = (
+    "total_positions", "winning_positions", "losing_positions", "total_position_pnl", "priced_positions",
+)
+_POSITION_STATS_SQL = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(pnl), 0),
+        COUNT(pnl)
+    FROM positions
+    WHERE closed_at IS NOT NULL AND {where}
+"""
+
+
+@dataclass(slots=True)
 class GameRecord:
     """Record of a game."""
     game_id: int
@@ -24,7 +58,7 @@ class GameRecord:
     status: str = "active"  # "active", "completed", "error"
     
 
-@dataclass
+@dataclass(slots=True)
 class PositionRecord:
     """Record of a position."""
     game_id: int
@@ -43,12 +77,26 @@ class GameDatabase:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # One long-lived connection in autocommit mode, shared across threads under a lock;
+        # sqlite3 keeps compiled statements in its per-connection statement cache
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
         self._init_db()
         
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+        
     def _init_db(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             # Games table
             cursor.execute("""
@@ -101,12 +149,77 @@ class GameDatabase:
                 )
             """)
             
-            conn.commit()
+            # Single-row running totals so get_statistics doesn't scan the history
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stats_summary (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    total_games INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    draws INTEGER NOT NULL DEFAULT 0,
+                    total_pnl REAL NOT NULL DEFAULT 0,
+                    total_duration_seconds REAL NOT NULL DEFAULT 0,
+                    timed_games INTEGER NOT NULL DEFAULT 0,
+                    total_positions INTEGER NOT NULL DEFAULT 0,
+                    winning_positions INTEGER NOT NULL DEFAULT 0,
+                    losing_positions INTEGER NOT NULL DEFAULT 0,
+                    total_position_pnl REAL NOT NULL DEFAULT 0,
+                    priced_positions INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO stats_summary (id) VALUES (1)")
+            if cursor.rowcount == 1:
+                # New summary row: backfill it from any existing history
+                zeros = (0,) * len(_GAME_SUMMARY_COLUMNS)
+                self._add_to_summary(cursor, _GAME_SUMMARY_COLUMNS, zeros, self._game_stats(cursor, "1 = 1", ()))
+                zeros = (0,) * len(_POSITION_SUMMARY_COLUMNS)
+                self._add_to_summary(
+                    cursor, _POSITION_SUMMARY_COLUMNS, zeros, self._position_stats(cursor, "1 = 1", ())
+                )
+            
+            # Indexes for the per-game position lookups, history ordering and statistics filters
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_game ON positions(game_id, opened_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_game_nonce ON positions(game_id, nonce)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_positions_closed ON positions(closed_at) WHERE closed_at IS NOT NULL"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_started ON games(started_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_status ON games(status)")
+            
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in one write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        
+    @staticmethod
+    def _game_stats(cursor: sqlite3.Cursor, where: str, params: Sequence[Any]) -> tuple:
+        cursor.execute(_GAME_STATS_SQL.format(where=where), params)
+        return cursor.fetchone()
+        
+    @staticmethod
+    def _position_stats(cursor: sqlite3.Cursor, where: str, params: Sequence[Any]) -> tuple:
+        cursor.execute(_POSITION_STATS_SQL.format(where=where), params)
+        return cursor.fetchone()
+        
+    @staticmethod
+    def _add_to_summary(cursor: sqlite3.Cursor, columns: Sequence[str], before: tuple, after: tuple):
+        """Apply the change in some rows' contribution (after - before) to stats_summary."""
+        deltas = [a - b for a, b in zip(after, before)]
+        if any(deltas):
+            assignments = ", ".join(f"{c} = {c} + ?" for c in columns)
+            cursor.execute(f"UPDATE stats_summary SET {assignments} WHERE id = 1", deltas)
             
     def record_game(self, game: GameRecord):
         """Record a new game."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock, self._transaction():
+            cursor = self._conn.cursor()
+            before = self._game_stats(cursor, "game_id = ?", (game.game_id,))
             cursor.execute("""
                 INSERT INTO games (
                     game_id, bot_address, opponent_address, bet_amount,
@@ -121,12 +234,14 @@ class GameDatabase:
                 game.role,
                 game.status
             ))
-            conn.commit()
+            after = self._game_stats(cursor, "game_id = ?", (game.game_id,))
+            self._add_to_summary(cursor, _GAME_SUMMARY_COLUMNS, before, after)
             
     def update_game_status(self, game_id: int, status: str, final_pnl: Optional[float] = None):
         """Update game status."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock, self._transaction():
+            cursor = self._conn.cursor()
+            before = self._game_stats(cursor, "game_id = ?", (game_id,))
             
             if final_pnl is not None:
                 result = "win" if final_pnl > 0 else "loss" if final_pnl < 0 else "draw"
@@ -141,13 +256,14 @@ class GameDatabase:
                     SET status = ?, ended_at = ?
                     WHERE game_id = ?
                 """, (status, datetime.now().isoformat(), game_id))
-                
-            conn.commit()
+            
+            after = self._game_stats(cursor, "game_id = ?", (game_id,))
+            self._add_to_summary(cursor, _GAME_SUMMARY_COLUMNS, before, after)
             
     def record_position(self, position: PositionRecord):
         """Record a new position."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute("""
                 INSERT INTO positions (
                     game_id, direction, nonce, opened_at, reasoning
@@ -159,23 +275,36 @@ class GameDatabase:
                 position.opened_at.isoformat(),
                 position.reasoning
             ))
-            conn.commit()
+            
+    def record_positions(self, positions: Sequence[PositionRecord]):
+        """Record several new positions in one transaction."""
+        with self._lock, self._transaction():
+            self._conn.executemany("""
+                INSERT INTO positions (
+                    game_id, direction, nonce, opened_at, reasoning
+                ) VALUES (?, ?, ?, ?, ?)
+            """, [
+                (p.game_id, p.direction, p.nonce, p.opened_at.isoformat(), p.reasoning)
+                for p in positions
+            ])
             
     def close_position(self, game_id: int, nonce: int, exit_price: Optional[float] = None, pnl: Optional[float] = None):
         """Close a position."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock, self._transaction():
+            cursor = self._conn.cursor()
+            before = self._position_stats(cursor, "game_id = ? AND nonce = ?", (game_id, nonce))
             cursor.execute("""
                 UPDATE positions 
                 SET closed_at = ?, exit_price = ?, pnl = ?
                 WHERE game_id = ? AND nonce = ?
             """, (datetime.now().isoformat(), exit_price, pnl, game_id, nonce))
-            conn.commit()
+            after = self._position_stats(cursor, "game_id = ? AND nonce = ?", (game_id, nonce))
+            self._add_to_summary(cursor, _POSITION_SUMMARY_COLUMNS, before, after)
             
     def get_last_position(self, game_id: int) -> Optional[PositionRecord]:
         """Get the last position for a game."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute("""
                 SELECT game_id, direction, nonce, opened_at, reasoning, closed_at, entry_price, exit_price, pnl
                 FROM positions 
@@ -201,8 +330,8 @@ class GameDatabase:
             
     def get_game_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get game history."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute("""
                 SELECT game_id, bot_address, opponent_address, bet_amount,
                        started_at, ended_at, role, final_pnl, result, status
@@ -211,74 +340,34 @@ class GameDatabase:
                 LIMIT ?
             """, (limit,))
             
-            games = []
-            for row in cursor.fetchall():
-                games.append({
-                    "game_id": row[0],
-                    "bot_address": row[1],
-                    "opponent_address": row[2],
-                    "bet_amount": row[3],
-                    "started_at": row[4],
-                    "ended_at": row[5],
-                    "role": row[6],
-                    "final_pnl": row[7],
-                    "result": row[8],
-                    "status": row[9]
-                })
-            return games
+            # Column names match the history dict keys
+            return [dict(row) for row in cursor.fetchall()]
             
     def get_statistics(self) -> Dict[str, Any]:
         """Get overall statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Game statistics
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_games,
-                    SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN result = 'loss' THEN 1 ELSE 0 END) as losses,
-                    SUM(CASE WHEN result = 'draw' THEN 1 ELSE 0 END) as draws,
-                    SUM(final_pnl) as total_pnl,
-                    AVG(CASE 
-                        WHEN ended_at IS NOT NULL 
-                        THEN (julianday(ended_at) - julianday(started_at)) * 86400 
-                        ELSE NULL 
-                    END) as avg_game_duration_seconds
-                FROM games 
-                WHERE status = 'completed'
-            """)
-            
-            game_stats = cursor.fetchone()
-            
-            # Position statistics
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_positions,
-                    SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as winning_positions,
-                    SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losing_positions,
-                    AVG(pnl) as avg_position_pnl
-                FROM positions 
-                WHERE closed_at IS NOT NULL
-            """)
-            
-            position_stats = cursor.fetchone()
+        with self._lock:
+            cursor = self._conn.cursor()
+            columns = _GAME_SUMMARY_COLUMNS + _POSITION_SUMMARY_COLUMNS
+            cursor.execute(f"SELECT {', '.join(columns)} FROM stats_summary WHERE id = 1")
+            row = cursor.fetchone()
             
-            return {
-                "games": {
-                    "total": game_stats[0] or 0,
-                    "wins": game_stats[1] or 0,
-                    "losses": game_stats[2] or 0,
-                    "draws": game_stats[3] or 0,
-                    "total_pnl": game_stats[4] or 0,
-                    "avg_duration_seconds": game_stats[5] or 0,
-                    "win_rate": (game_stats[1] or 0) / (game_stats[0] or 1) if game_stats[0] else 0
-                },
-                "positions": {
-                    "total": position_stats[0] or 0,
-                    "winning": position_stats[1] or 0,
-                    "losing": position_stats[2] or 0,
-                    "avg_pnl": position_stats[3] or 0,
-                    "win_rate": (position_stats[1] or 0) / (position_stats[0] or 1) if position_stats[0] else 0
-                }
-            }
\ No newline at end of file
+        (total_games, wins, losses, draws, total_pnl, total_duration, timed_games,
+         total_positions, winning_positions, losing_positions, total_position_pnl, priced_positions) = row
+        return {
+            "games": {
+                "total": total_games,
+                "wins": wins,
+                "losses": losses,
+                "draws": draws,
+                "total_pnl": total_pnl,
+                "avg_duration_seconds": total_duration / timed_games if timed_games else 0,
+                "win_rate": wins / total_games if total_games else 0
+            },
+            "positions": {
+                "total": total_positions,
+                "winning": winning_positions,
+                "losing": losing_positions,
+                "avg_pnl": total_position_pnl / priced_positions if priced_positions else 0,
+                "win_rate": winning_positions / total_positions if total_positions else 0
+            }
+        }
@@ -5,10 +5,12 @@ Game manager for handling game lifecycle.
 import asyncio
 import logging
 import time
-from typing import Dict, Optional, List, Tuple, Any
+from decimal import Decimal
+from typing import Dict, Optional, List, Tuple, Any, Union
 from datetime import datetime, timedelta
-import random
+import secrets
 
+from eth_hash.auto import keccak
 from web3 import Web3
 from web3.contract import Contract
 
@@ -19,8 +21,11 @@ from blockchain import (
     Direction,
     get_active_games,
     get_player_game_info,
+    get_game_and_player_info,
+    get_games_batch,
+    multicall_supported,
 )
-from blockchain.transactions import build_sign_send_transaction
+from blockchain.transactions import build_sign_send_transaction_async
 
 from config import BotConfig
 from alith_client import AlithClient, MarketData, GameState, TradingDecision
@@ -32,6 +37,69 @@ from websocket_client import WebSocketClient
 
 logger = logging.getLogger(__name__)
 
+# WebSocket message types that signal a change in a running game
+GAME_UPDATE_MESSAGE_TYPES = ("price_update", "pnl_update", "state_change")
+# Longest the game loop waits for a game update before re-reading the chain anyway
+GAME_LOOP_MAX_WAIT_SECONDS = 5.0
+# How long a pool's market data is shared between game loops
+MARKET_DATA_CACHE_TTL_SECONDS = 0.5
+# Bounds of the back-off between WebSocket reconnect attempts
+WS_RECONNECT_MIN_SECONDS = 1.0
+WS_RECONNECT_MAX_SECONDS = 30.0
+# A WebSocket connection that stays up this long resets the reconnect back-off
+WS_STABLE_CONNECTION_SECONDS = 60.0
+# How long the monitor skips its playerGameInfo poll after we start a game loop ourselves
+JOIN_MONITOR_COOLDOWN_SECONDS = 5.0
+# Number of recent PnL wei -> ETH conversions kept (PnL only changes on chain updates)
+PNL_CONVERSION_CACHE_SIZE = 16
+# Unchanged ticks are only skipped while at least this many seconds of the game remain
+UNCHANGED_TICK_SKIP_MIN_REMAINING_SECONDS = 10
+# Position write-behind: most records per transaction, and how long to wait for more
+DB_WRITE_BATCH_SIZE = 16
+DB_WRITE_COALESCE_SECONDS = 0.05
+# Seconds before the game end at which an open position is auto-closed
+AUTO_CLOSE_SECONDS = 5
+
+# games() fields for our side and the opponent's, keyed by whether we are player1
+_PLAYER_FIELDS = {
+    True: {
+        "my_pool": "player1Pool", "opponent_pool": "player2Pool", "opponent": "player2",
+        "opponent_position": "player2Position", "my_pnl": "player1Pnl", "opponent_pnl": "player2Pnl",
+    },
+    False: {
+        "my_pool": "player2Pool", "opponent_pool": "player1Pool", "opponent": "player1",
+        "opponent_position": "player1Position", "my_pnl": "player2Pnl", "opponent_pnl": "player1Pnl",
+    },
+}
+
+
+# Direction enum for the position names tracked by the game loop
+_DIR_BY_NAME = {"long": Direction.Long, "short": Direction.Short}
+
+
+def _is_uint256(value: int) -> bool:
+    """Whether value fits a uint256 argument.
+
+    One shift covers both bounds: it leaves 0 only for 0 <= value < 2**256
+    (negative ints shift to -1).
+    """
+    return not value >> 256
+
+
+def _encode_hash_preimage(game_id: int, direction: int, nonce: int) -> bytes:
+    """abi.encode(uint256, uint8, uint256): three big-endian 32-byte words."""
+    return game_id.to_bytes(32, 'big') + direction.to_bytes(32, 'big') + nonce.to_bytes(32, 'big')
+
+
+def _compute_hashed_direction(game_id: int, direction: Direction, nonce: int) -> bytes:
+    """keccak256(abi.encode(gameId, direction, nonce)), the postPosition commitment."""
+    return keccak(_encode_hash_preimage(game_id, int(direction), int(nonce)))
+
+
+def _hex_to_bytes(value: str) -> bytes:
+    """Decode hex with or without a 0x prefix."""
+    return bytes.fromhex(value[2:] if value.startswith(("0x", "0X")) else value)
+
 
 class GameManager:
     """Manages game lifecycle and trading decisions."""
@@ -41,13 +109,22 @@ class GameManager:
         self.alith_client = alith_client
         self.db = db
         
-        # Initialize blockchain connection
-        self.web3 = get_web3_connection(config.rpc_url)
+        # Initialize blockchain connection (connectivity is checked off-loop in start())
+        self.web3 = get_web3_connection(config.rpc_url, check_connection=False)
         self.contract = get_contract(self.web3, config.contract_address)
+        # Bound contract function builders used on the transaction paths
+        self._fn_join_game = self.contract.functions.joinGame
+        self._fn_post_position = self.contract.functions.postPosition
+        self._fn_close_position = self.contract.functions.closePosition
+        self._fn_finish_game = self.contract.functions.finishGame
         
         # Get bot address
         self.bot_account = self.web3.eth.account.from_key(config.bot_private_key)
         self.bot_address = self.bot_account.address
+        self.bot_address_lower = self.bot_address.lower()
+        # joinGame stake, converted from ETH once, and the transaction params carrying it
+        self._bet_amount_wei = self.web3.to_wei(config.bet_amount_eth, 'ether')
+        self._join_tx_params = {'value': self._bet_amount_wei}
         
         # Initialize backend client
         self.backend_client = BackendClient(
@@ -65,12 +142,40 @@ class GameManager:
         self.websocket_client = WebSocketClient(ws_url, "")
         self.websocket_task: Optional[asyncio.Task] = None
         self._last_ws_token_sent: Optional[str] = None
+        self._ws_reconnect_task: Optional[asyncio.Task] = None
+        # Back-off before the next reconnect attempt; kept across attempts so a server that
+        # accepts and then drops the socket can't drive a tight reconnect loop
+        self._ws_reconnect_delay = 0.0
+        self._ws_connected_at: Optional[float] = None
+        # Reconnect with the fresh token as soon as a refresh issues one
+        self.backend_client.on_token_issued = self._on_token_issued
         
         # Initialize price feed manager
         self.price_feed_manager = PriceFeedManager(self.web3, self.contract, self.backend_client)
+        # Short-lived market data per pool: pool -> (fetched_at monotonic, data), plus in-flight fetches
+        self._pool_md_cache: Dict[str, Tuple[float, MarketData]] = {}
+        self._pool_md_tasks: Dict[str, asyncio.Task] = {}
         
         # Track active games
         self.active_games: Dict[int, asyncio.Task] = {}
+        # Per-game queues of WS updates that wake the game loop
+        self._game_events: Dict[int, asyncio.Queue] = {}
+        
+        # Last playerGameInfo read as (monotonic timestamp, info); cleared on WS events
+        self._player_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Recent abs(PnL) conversions, wei -> ETH, evicted oldest first
+        self._pnl_eth_cache: Dict[int, Union[int, Decimal]] = {}
+        # Last position opened per running game, so close/finish don't re-query SQLite for its nonce
+        self._last_position_cache: Dict[int, PositionRecord] = {}
+        # Bounds the transactions in flight across all games (node rate limits, nonce ordering)
+        self._tx_sem = asyncio.Semaphore(config.max_concurrent_txs)
+        # Positions waiting to be written by _db_writer (None asks it to flush and stop)
+        self._db_queue: asyncio.Queue[Optional[PositionRecord]] = asyncio.Queue()
+        self._db_writer_task: Optional[asyncio.Task] = None
+        # Set to wake the monitor loop before its interval elapses
+        self._monitor_wake = asyncio.Event()
+        # Monotonic time until which the monitor trusts a game loop we just started
+        self._skip_monitor_until = 0.0
         
         # Track the trading fight UUID we are currently joining (to call start-fight later)
         self.pending_trading_fight_id: Optional[str] = None
@@ -84,6 +189,11 @@ class GameManager:
         """Start the game manager."""
         logger.info(f"\033[94m🚀 Starting game manager for bot address: {self.bot_address}\033[0m")
         self.running = True
+        self._db_writer_task = asyncio.create_task(self._db_writer())
+        
+        if not await asyncio.to_thread(self.web3.is_connected):
+            raise ConnectionError(f"Failed to connect to {self.config.rpc_url}")
+        logger.info(f"Connected to blockchain at {self.config.rpc_url}")
         
         # Initialize backend client session
         await self.backend_client.__aenter__()
@@ -91,8 +201,8 @@ class GameManager:
         # Authenticate to get JWT token
         await self.backend_client._authenticate()
         
-        # Connect to WebSocket for notifications
-        await self._connect_websocket_with_current_token()
+        # Connect to WebSocket for notifications in the background; it keeps retrying until connected
+        self._schedule_websocket_reconnect()
         
         # Start monitoring loop
         monitor_task = asyncio.create_task(self._monitor_games())
@@ -117,9 +227,16 @@ class GameManager:
             await asyncio.gather(*self.active_games.values(), return_exceptions=True)
             
         # Disconnect from WebSocket
-        if hasattr(self, 'websocket_task'):
+        if self._ws_reconnect_task is not None:
+            self._ws_reconnect_task.cancel()
+        if self.websocket_task is not None:
             self.websocket_task.cancel()
-            await self.websocket_client.disconnect()
+        await self.websocket_client.disconnect()
+            
+        # Flush positions still waiting to be written
+        if self._db_writer_task is not None:
+            self._db_queue.put_nowait(None)
+            await self._db_writer_task
             
         # Clean up backend client session
         await self.backend_client.__aexit__(None, None, None)
@@ -129,64 +246,128 @@ class GameManager:
     async def _monitor_games(self):
         """Monitor for available games to join."""
         logger.info("\033[92m🔄 Starting game monitoring loop...\033[0m")
-        last_ws_status_time = 0
-        ws_status_interval = 5  # Log WebSocket status every 5 seconds
         
         while self.running:
             try:
-                # Ensure WS connection is healthy and token is up to date
-                await self._ensure_websocket_health()
-
-                # Log WebSocket status periodically
-                current_time = time.time()
-                if current_time - last_ws_status_time >= ws_status_interval:
-                    logger.info(f"\033[96m📊 Status: {self.websocket_client.get_status_info()}\033[0m")
-                    last_ws_status_time = current_time
-                
-                # Check if bot is already in a game
-                player_info = get_player_game_info(self.contract, self.bot_address)
-                logger.info(f"\033[93m👤 Player info: {player_info}\033[0m")
-                
-                if not player_info["inGame"]:
-                    # Bot is not in a game, look for games to join
-                    logger.info("\033[33m🔍 Bot not in game, searching for games to join...\033[0m")
-                    if not self.active_games:  # No active game being tracked
-                        await self._find_and_join_game()
-                else:
-                    # Bot is in a game, make sure we're tracking it
-                    game_id = player_info["gameId"]
-                    logger.info(f"\033[92m🎮 Bot is in game {game_id}\033[0m")
-                    if game_id not in self.active_games:
-                        logger.info(f"\033[94m🎯 Found existing game {game_id}, starting game loop\033[0m")
-                        task = asyncio.create_task(self._game_loop(game_id))
-                        self.active_games[game_id] = task
-                
-                # Clean up completed games
-                completed_games = []
-                for game_id, task in self.active_games.items():
-                    if task.done():
-                        completed_games.append(game_id)
-                        
-                for game_id in completed_games:
-                    del self.active_games[game_id]
+                # Check if bot is already in a game, unless a game loop was just started
+                # from a join event and owns the state reads for now
+                if time.monotonic() >= self._skip_monitor_until:
+                    player_info = await self._get_player_info_cached()
+                    logger.info(f"\033[93m👤 Player info: {player_info}\033[0m")
                     
+                    if not player_info["inGame"]:
+                        # Bot is not in a game, look for games to join
+                        logger.info("\033[33m🔍 Bot not in game, searching for games to join...\033[0m")
+                        if not self.active_games:  # No active game being tracked
+                            await self._find_and_join_game()
+                    else:
+                        # Bot is in a game, make sure we're tracking it
+                        game_id = player_info["gameId"]
+                        logger.info(f"\033[92m🎮 Bot is in game {game_id}\033[0m")
+                        if game_id not in self.active_games:
+                            logger.info(f"\033[94m🎯 Found existing game {game_id}, starting game loop\033[0m")
+                            self._start_game_loop(game_id)
+                
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}")
                 
             # Use different intervals based on whether we're in a game or searching
             if self.active_games:
                 # In game - monitor more frequently
-                logger.debug(f"Sleeping {self.config.monitor_interval_seconds}s (in game)")
-                await asyncio.sleep(self.config.monitor_interval_seconds)
+                interval = self.config.monitor_interval_seconds
+                logger.debug(f"Sleeping {interval}s (in game)")
             else:
                 # Searching for games - can be less frequent
-                logger.debug(f"Sleeping {self.config.game_search_interval_seconds}s (searching)")
-                await asyncio.sleep(self.config.game_search_interval_seconds)
+                interval = self.config.game_search_interval_seconds
+                logger.debug(f"Sleeping {interval}s (searching)")
+            # Join events and finished games wake the monitor early
+            try:
+                await asyncio.wait_for(self._monitor_wake.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            self._monitor_wake.clear()
 
-    async def _connect_websocket_with_current_token(self) -> None:
-        """Connect WS using the latest JWT and start listener."""
-        # Make sure we have a token
-        await self.backend_client._authenticate()
+    def _wei_to_eth(self, wei: int) -> Union[int, Decimal]:
+        """Convert abs(wei) to ETH, reusing recent results since PnL rarely changes between ticks."""
+        if wei == 0:
+            return 0
+        eth = self._pnl_eth_cache.get(wei)
+        if eth is None:
+            eth = self._pnl_eth_cache[wei] = Web3.from_wei(abs(wei), "ether")
+            if len(self._pnl_eth_cache) > PNL_CONVERSION_CACHE_SIZE:
+                del self._pnl_eth_cache[next(iter(self._pnl_eth_cache))]
+        return eth
+
+    async def _send_transaction(self, function_call, tx_params: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+        """Sign and send a contract call from the bot account, at most max_concurrent_txs at a time."""
+        async with self._tx_sem:
+            return await build_sign_send_transaction_async(
+                self.web3, function_call, self.config.bot_private_key, tx_params
+            )
+
+    async def _db_writer(self) -> None:
+        """Write queued positions off the event loop, coalescing bursts into one transaction."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._db_queue.get()
+            batch: List[PositionRecord] = []
+            if item is None:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = loop.time() + DB_WRITE_COALESCE_SECONDS
+                while len(batch) < DB_WRITE_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._db_queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+            if not batch:
+                continue
+            try:
+                await asyncio.to_thread(self.db.record_positions, batch)
+            except Exception as e:
+                logger.error("\033[31m❌ Failed to record %d position(s): %s\033[0m", len(batch), e)
+
+    def _get_last_position(self, game_id: int) -> Optional[PositionRecord]:
+        """Last position opened in a game, from the per-game cache or else the database."""
+        return self._last_position_cache.get(game_id) or self.db.get_last_position(game_id)
+
+    def _start_game_loop(self, game_id: int) -> None:
+        """Start tracking a game unless a loop for it is already running."""
+        task = self.active_games.get(game_id)
+        if task is not None and not task.done():
+            return
+        task = asyncio.create_task(self._game_loop(game_id))
+        self.active_games[game_id] = task
+        task.add_done_callback(lambda t, gid=game_id: self._on_game_loop_done(gid, t))
+
+    def _on_game_loop_done(self, game_id: int, task: asyncio.Task) -> None:
+        """Drop a finished game (unless a newer loop took its place) and let the monitor look for the next one."""
+        if self.active_games.get(game_id) is task:
+            del self.active_games[game_id]
+        self._monitor_wake.set()
+
+    async def _get_player_info_cached(self) -> Dict[str, Any]:
+        """Return the bot's playerGameInfo, re-reading the chain only once the cached copy expires."""
+        cached = self._player_info_cache
+        if cached is not None and time.monotonic() - cached[0] < self.config.player_info_cache_ttl:
+            return cached[1]
+        player_info = await asyncio.to_thread(get_player_game_info, self.contract, self.bot_address)
+        self._player_info_cache = (time.monotonic(), player_info)
+        return player_info
+
+    async def _connect_websocket_with_current_token(self) -> bool:
+        """Connect WS using the latest JWT and start listener; returns whether it connected."""
+        # Make sure we have a token that isn't about to expire; no backend call if it's still valid
+        await self.backend_client.ensure_valid_token()
         # Recreate or reuse client with updated token
         self.websocket_client.auth_token = self.backend_client.auth_token or ""
         # Ensure any previous WS is closed
@@ -200,24 +381,56 @@ class GameManager:
             # Add handlers once (idempotent)
             self.websocket_client.add_message_handler("signature_ready", self._handle_signature_ready)
             self.websocket_client.add_message_handler("game_joined", self._handle_game_joined)
-            # Start listening
+            for message_type in GAME_UPDATE_MESSAGE_TYPES:
+                self.websocket_client.add_message_handler(message_type, self._handle_game_update)
+            # Start listening; the listener ends when the connection drops (pings time out)
             self.websocket_task = asyncio.create_task(self.websocket_client.listen())
+            self.websocket_task.add_done_callback(self._on_websocket_done)
             self._last_ws_token_sent = self.backend_client.auth_token
-        else:
-            logger.warning("\033[33m⚠️  Failed to (re)connect WebSocket\033[0m")
-
-    async def _ensure_websocket_health(self) -> None:
-        """Reconnect WS if disconnected or token changed after refresh."""
-        # If not connected/running, reconnect
-        ws_connected = bool(self.websocket_client.websocket) and bool(self.websocket_client.running)
-        if not ws_connected:
-            await self._connect_websocket_with_current_token()
+            self._ws_connected_at = time.monotonic()
+            return True
+        logger.warning("\033[33m⚠️  Failed to (re)connect WebSocket\033[0m")
+        return False
+
+    def _on_websocket_done(self, task: asyncio.Task) -> None:
+        """Reconnect when the listener ends on its own (not when we cancelled it)."""
+        if task.cancelled() or task is not self.websocket_task:
             return
-        # If token changed (e.g., after refresh), reconnect with fresh token
-        current_token = self.backend_client.auth_token
-        if current_token and current_token != self._last_ws_token_sent:
+        logger.info("\033[96m📊 Status: %s\033[0m", self.websocket_client.get_status_info())
+        self._schedule_websocket_reconnect()
+
+    def _on_token_issued(self, token: str) -> None:
+        """Reconnect the WebSocket when a refresh replaces the token it authenticated with."""
+        if self._last_ws_token_sent is not None and token != self._last_ws_token_sent:
             logger.info("\033[93m🔄 JWT refreshed; reconnecting WebSocket with fresh token\033[0m")
-            await self._connect_websocket_with_current_token()
+            self._schedule_websocket_reconnect()
+
+    def _schedule_websocket_reconnect(self) -> None:
+        """Start a background reconnect unless one is already in progress."""
+        if not self.running:
+            return
+        if self._ws_reconnect_task is None or self._ws_reconnect_task.done():
+            if (
+                self._ws_connected_at is not None
+                and time.monotonic() - self._ws_connected_at >= WS_STABLE_CONNECTION_SECONDS
+            ):
+                self._ws_reconnect_delay = 0.0
+            self._ws_reconnect_task = asyncio.create_task(self._reconnect_websocket())
+
+    async def _reconnect_websocket(self) -> None:
+        """Reconnect with the current token, backing off until a connection stays up."""
+        while self.running:
+            if self._ws_reconnect_delay:
+                await asyncio.sleep(self._ws_reconnect_delay)
+            # The next attempt backs off further unless this connection proves stable
+            self._ws_reconnect_delay = min(
+                max(self._ws_reconnect_delay * 2, WS_RECONNECT_MIN_SECONDS), WS_RECONNECT_MAX_SECONDS
+            )
+            try:
+                if await self._connect_websocket_with_current_token():
+                    return
+            except Exception as e:
+                logger.error("\033[31m❌ Error reconnecting WebSocket: %s\033[0m", e)
 
     async def _find_and_join_game(self):
         """Find and join an available game."""
@@ -248,7 +461,7 @@ class GameManager:
                     # Backend returns UUID in 'id' field - use it as game_id like frontend does
                     game_id = game_data.get("id")  # Use UUID as game_id
                     if game_id is None:
-                        logger.debug(f"No id found in game_data: {game_data}")
+                        logger.debug("No id found in game_data: %s", game_data)
                         continue
                         
                     logger.info(f"Found game with UUID game_id: {game_id}")
@@ -281,7 +494,7 @@ class GameManager:
         if not games:
             return []
 
-        async def check_game(game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async def resolve_game_id(game: Dict[str, Any]) -> Optional[int]:
             tx_hash = (
                 game.get("txid")
                 or game.get("tx_hash")
@@ -292,33 +505,54 @@ class GameManager:
                 return None
             try:
                 # Get receipt in thread executor to avoid blocking loop
-                receipt = await asyncio.get_event_loop().run_in_executor(
-                    None, self.web3.eth.get_transaction_receipt, tx_hash
-                )
+                receipt = await asyncio.to_thread(self.web3.eth.get_transaction_receipt, tx_hash)
                 # Decode GameCreated event to extract gameId
                 events = self.contract.events.GameCreated().process_receipt(receipt)
                 if not events:
                     logger.info(f"No GameCreated event in tx {tx_hash}; dropping fight {game.get('id')}")
                     return None
-                onchain_game_id = int(events[0]["args"]["gameId"])  # type: ignore[index]
-                # Fetch current game info
-                info = get_game_info(self.contract, onchain_game_id)
-                # GameState: 1 = Created, 2 = Started, 3 = Finished (by convention in our code)
-                if info["state"] != 1:
-                    logger.info(
-                        f"Filtering out stale fight {game.get('id')} (gameId {onchain_game_id}) with state {info['state']}"
-                    )
-                    return None
-                # Attach on-chain numeric id for downstream usage if needed
-                game["onchain_game_id"] = onchain_game_id
-                return game
+                return int(events[0]["args"]["gameId"])  # type: ignore[index]
             except Exception as e:
                 logger.debug(f"On-chain validation failed for fight {game.get('id')}: {e}")
                 return None
 
-        # Run checks concurrently
-        checked = await asyncio.gather(*(check_game(g) for g in games))
-        return [g for g in checked if g]
+        # Resolve on-chain ids concurrently
+        resolved = await asyncio.gather(*(resolve_game_id(g) for g in games))
+        candidates = [(g, gid) for g, gid in zip(games, resolved) if gid is not None]
+        if not candidates:
+            return []
+
+        # Fetch current game info for all candidates in one batched read
+        game_ids = [gid for _, gid in candidates]
+        infos: List[Optional[Dict[str, Any]]] = []
+        if multicall_supported(self.web3):
+            try:
+                infos = await asyncio.to_thread(get_games_batch, self.contract, game_ids)
+            except Exception as e:
+                logger.debug("Batched game read failed (%s); reading games one by one", e)
+        if not infos:
+            for gid in game_ids:
+                try:
+                    infos.append(await asyncio.to_thread(get_game_info, self.contract, gid))
+                except Exception as inner:
+                    logger.debug("On-chain read failed for gameId %s: %s", gid, inner)
+                    infos.append(None)
+
+        valid = []
+        for (game, onchain_game_id), info in zip(candidates, infos):
+            if info is None:
+                continue
+            # GameState: 1 = Created, 2 = Started, 3 = Finished (by convention in our code)
+            if info["state"] != 1:
+                logger.info(
+                    f"Filtering out stale fight {game.get('id')} (gameId {onchain_game_id}) with state {info['state']}"
+                )
+                continue
+            # Attach on-chain numeric id for downstream usage if needed
+            game["onchain_game_id"] = onchain_game_id
+            valid.append(game)
+        return valid
+
     async def _join_game(self, game_id: str, game_data: Dict):
         """Join a specific game using UUID from backend."""
         try:
@@ -348,7 +582,7 @@ class GameManager:
                 return
                 
             logger.info(f"\033[92m✅ Successfully added opponent to fight: {game_id}\033[0m")
-            logger.info(f"\033[93m📋 Result: {result}\033[0m")
+            logger.debug("Add opponent result: %s", result)
             
             # TODO: After adding opponent, we need to handle the actual blockchain join
             # This might involve getting the numeric game_id and calling joinGame on contract
@@ -359,6 +593,8 @@ class GameManager:
             
     async def _handle_signature_ready(self, data: Dict[str, Any]):
         """Handle signature ready notification from WebSocket."""
+        # Our on-chain game state is about to change; force the next poll to re-read it
+        self._player_info_cache = None
         try:
             logger.info(f"\033[94m📝 Received signature ready notification: {data}\033[0m")
             
@@ -404,7 +640,7 @@ class GameManager:
                 signature_expiration = timestamp + ttl
                 
                 # Convert signature from hex string to bytes
-                signature_bytes = bytes.fromhex(signature.replace("0x", ""))
+                signature_bytes = _hex_to_bytes(signature)
                 
                 logger.info(f"\033[94m🚀 Calling joinGame on blockchain...\033[0m")
                 logger.info(f"\033[93m📊 Game ID: {numeric_game_id}\033[0m")
@@ -412,7 +648,7 @@ class GameManager:
                 logger.info(f"\033[93m⏰ Expiration: {signature_expiration}\033[0m")
                 
                 # Build joinGame transaction
-                join_game_function = self.contract.functions.joinGame(
+                join_game_function = self._fn_join_game(
                     numeric_game_id,
                     pool_address,
                     signature_expiration,
@@ -420,18 +656,20 @@ class GameManager:
                 )
                 
                 # Send transaction
-                tx_hash, receipt = build_sign_send_transaction(
-                    self.web3,
+                tx_hash, receipt = await self._send_transaction(
                     join_game_function,
-                    self.config.bot_private_key,
-                    {'value': self.web3.to_wei(self.config.bet_amount_eth, 'ether')}
+                    self._join_tx_params
                 )
                 
                 logger.info(f"\033[92m✅ Successfully called joinGame! Transaction: {tx_hash}\033[0m")
                 logger.info(f"\033[93m📋 Gas used: {receipt['gasUsed']}\033[0m")
+                # A poll during the send may have cached the pre-join state
+                self._player_info_cache = None
+                # We know we're in the game now; start trading without waiting for the next poll
+                self._start_game_loop(numeric_game_id)
+                self._skip_monitor_until = time.monotonic() + JOIN_MONITOR_COOLDOWN_SECONDS
+                self._monitor_wake.set()
                 
-                # Notify backend about successful join (optional) and start fight in backend
-                await self.backend_client.notify_game_joined(numeric_game_id, tx_hash)
                 # Frontend calls start-fight after successful join; replicate here using UUID
                 # Prefer trading_fight_id from WS payload if present, otherwise fallback to the pending UUID set at join time
                 trading_fight_uuid = (
@@ -440,12 +678,19 @@ class GameManager:
                     else None
                 ) or self.pending_trading_fight_id
 
+                # Notify backend about successful join (optional) and start fight in backend;
+                # the two calls are independent, so run them concurrently
+                backend_calls = {"notify game joined": self.backend_client.notify_game_joined(numeric_game_id, tx_hash)}
                 if trading_fight_uuid:
-                    await self.backend_client.start_trading_fight(trading_fight_uuid)
+                    backend_calls["start trading fight"] = self.backend_client.start_trading_fight(trading_fight_uuid)
                 else:
                     logger.warning(
                         "No trading_fight_id UUID available to call start-fight; skipping notification"
                     )
+                results = await asyncio.gather(*backend_calls.values(), return_exceptions=True)
+                for name, result in zip(backend_calls, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"\033[31m❌ Failed to {name} for game {numeric_game_id}: {result}\033[0m")
                 # Clear pending UUID after attempt
                 self.pending_trading_fight_id = None
                 
@@ -457,6 +702,8 @@ class GameManager:
             
     async def _handle_game_joined(self, data: Dict[str, Any]):
         """Handle game joined notification from WebSocket."""
+        self._player_info_cache = None
+        self._monitor_wake.set()
         try:
             logger.info(f"\033[94m🎮 Received game joined notification: {data}\033[0m")
             
@@ -470,39 +717,111 @@ class GameManager:
                 
             logger.info(f"\033[92m🎯 Game {game_id} joined by {player_address}\033[0m")
             
-            # TODO: Start game loop if we joined the game
-            # This will be implemented once we have the complete flow
-            logger.info(f"\033[94m🚀 Ready to start game loop for game {game_id}\033[0m")
+            # Start the game loop right away if we are the one who joined, instead of
+            # waiting for the monitor's next playerGameInfo poll to notice
+            if str(player_address).lower() == self.bot_address_lower:
+                try:
+                    numeric_game_id = int(game_id)
+                except (TypeError, ValueError):
+                    logger.debug("Game joined notification without a numeric game_id: %s", game_id)
+                    return
+                if numeric_game_id not in self.active_games:
+                    logger.info(f"\033[94m🚀 Starting game loop for game {numeric_game_id}\033[0m")
+                    self._start_game_loop(numeric_game_id)
+                self._skip_monitor_until = time.monotonic() + JOIN_MONITOR_COOLDOWN_SECONDS
             
         except Exception as e:
             logger.error(f"\033[31m❌ Error handling game joined notification: {e}\033[0m")
             
+    async def _handle_game_update(self, data: Dict[str, Any]):
+        """Wake the game loop of the game a WebSocket update refers to."""
+        try:
+            queue = self._game_events.get(int(data.get("game_id")))
+        except (TypeError, ValueError):
+            logger.debug("Game update without a numeric game_id: %s", data)
+            return
+        if queue is not None:
+            queue.put_nowait(data)
+
+    async def _wait_for_game_event(self, game_id: int, game_end_timestamp: int) -> None:
+        """Sleep until a WS update for the game arrives or the next deadline needs a re-check.
+
+        The wait is capped so the loop still wakes in time to auto-close before the game ends.
+        """
+        timeout = GAME_LOOP_MAX_WAIT_SECONDS
+        if game_end_timestamp > 0:
+            until_auto_close = game_end_timestamp - AUTO_CLOSE_SECONDS - time.time()
+            timeout = min(timeout, max(until_auto_close, 1.0))
+        queue = self._game_events[game_id]
+        try:
+            await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return
+        # Coalesce a burst of updates into one iteration
+        while not queue.empty():
+            queue.get_nowait()
+
+    async def _read_game_snapshot(self, game_id: int, extra_calls: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+        """Read game info, our player info and extra_calls' returndata in one multicall.
+
+        Falls back to separate reads, with no extra results, when the multicall fails
+        (no Multicall3 on the chain, or one of the sub-calls reverted).
+        """
+        if multicall_supported(self.web3):
+            try:
+                return await asyncio.to_thread(
+                    get_game_and_player_info, self.contract, game_id, self.bot_address, extra_calls
+                )
+            except Exception as e:
+                logger.debug("Multicall game read failed (%s); reading game and player info separately", e)
+        game_info = await asyncio.to_thread(get_game_info, self.contract, game_id)
+        player_info = await asyncio.to_thread(get_player_game_info, self.contract, self.bot_address)
+        return {"game": game_info, "player": player_info, "extra": []}
+
     async def _game_loop(self, game_id: int):
         """Main game loop for a specific game."""
         logger.info(f"\033[94m🎮 Starting game loop for game {game_id}\033[0m")
+        self._game_events[game_id] = asyncio.Queue()
         
         try:
             game_start_time = datetime.now()
             current_position = None
             position_entry_price = None
             position_open_time = None
+            my_pool: Optional[str] = None
+            # Our side of the game never changes, so resolve it on the first read
+            fields: Optional[Dict[str, str]] = None
+            # What the last decision was based on; see the unchanged-tick check below
+            last_sig: Optional[Tuple[Any, ...]] = None
             
             while self.running:
                 try:
-                    # Get current game info
-                    game_info = get_game_info(self.contract, game_id)
+                    # Get current game info, our player info and (once our pool is known, and
+                    # unless its price comes from the backend) its reserves in one eth_call; the player info refreshes the
+                    # monitor's cache so it skips its own read
+                    extra_calls = (
+                        [self.price_feed_manager.reserves_call(my_pool)]
+                        if my_pool and self.price_feed_manager.wants_reserves(my_pool)
+                        else []
+                    )
+                    snapshot = await self._read_game_snapshot(game_id, extra_calls)
+                    game_info = snapshot["game"]
+                    self._player_info_cache = (time.monotonic(), snapshot["player"])
+                    if my_pool and snapshot["extra"]:
+                        self.price_feed_manager.prefetch_reserves(my_pool, snapshot["extra"][0])
+                    # One clock reading per tick, taken right after the state it is compared with
+                    now_ts = time.time()
+                    now_dt = datetime.fromtimestamp(now_ts)
                     
-                    # Log game state for debugging
-                    logger.info(f"\033[96m🔍 Game {game_id} state: {game_info['state']}\033[0m")
-                    logger.info(f"\033[96m🔍 Game end timestamp: {game_info['gameEndTimestamp']}\033[0m")
-                    logger.info(f"\033[96m🔍 Current time: {int(time.time())}\033[0m")
-                    logger.info(f"\033[96m🔍 Player1: {game_info['player1']}\033[0m")
-                    logger.info(f"\033[96m🔍 Player2: {game_info['player2']}\033[0m")
-                    logger.info(f"\033[96m🔍 Bet amount: {game_info['betAmount']}\033[0m")
-                    logger.info(f"\033[96m🔍 Player1 PnL: {game_info['player1Pnl']}\033[0m")
-                    logger.info(f"\033[96m🔍 Player2 PnL: {game_info['player2Pnl']}\033[0m")
-                    logger.info(f"\033[96m🔍 Player1 position state: {game_info['player1Position']['state']}\033[0m")
-                    logger.info(f"\033[96m🔍 Player2 position state: {game_info['player2Position']['state']}\033[0m")
+                    # Log game state for debugging; one lazily formatted line per tick
+                    logger.debug(
+                        "Game %d state=%d end=%d now=%d player1=%s player2=%s bet=%d "
+                        "player1_pnl=%d player2_pnl=%d player1_position=%d player2_position=%d",
+                        game_id, game_info["state"], game_info["gameEndTimestamp"], int(now_ts),
+                        game_info["player1"], game_info["player2"], game_info["betAmount"],
+                        game_info["player1Pnl"], game_info["player2Pnl"],
+                        game_info["player1Position"]["state"], game_info["player2Position"]["state"],
+                    )
                     
                     # Check if game has ended (state == 3 = Finished)
                     if game_info["state"] == 3:  # Finished state
@@ -516,15 +835,15 @@ class GameManager:
                         continue
                         
                     # Check if game timeout reached (60 seconds from start)
-                    if game_info["gameEndTimestamp"] > 0 and time.time() > game_info["gameEndTimestamp"]:
+                    if game_info["gameEndTimestamp"] > 0 and now_ts > game_info["gameEndTimestamp"]:
                         logger.info(f"\033[93m⏰ Game {game_id} reached timeout, finishing...\033[0m")
                         await self._finish_game(game_id, current_position)
                         break
                         
                     # Auto-close position if less than 5 seconds remaining
                     if game_info["gameEndTimestamp"] > 0 and current_position:
-                        time_until_end = game_info["gameEndTimestamp"] - time.time()
-                        if time_until_end <= 5:
+                        time_until_end = game_info["gameEndTimestamp"] - now_ts
+                        if time_until_end <= AUTO_CLOSE_SECONDS:
                             logger.info(f"\033[93m⏰ Auto-closing position - {time_until_end:.1f}s until game end\033[0m")
                             # Force close position decision
                             close_decision = TradingDecision(
@@ -537,14 +856,40 @@ class GameManager:
                             position_entry_price = None
                             position_open_time = None
                             continue
-                        
+
+                    # Inside the auto-close window with nothing open there is nothing left to
+                    # decide; just wait for the game to end instead of asking the AI
+                    if game_info["gameEndTimestamp"] > 0 and game_info["gameEndTimestamp"] - now_ts <= AUTO_CLOSE_SECONDS:
+                        await self._wait_for_game_event(game_id, game_info["gameEndTimestamp"])
+                        continue
+
                     # Determine which pool we're using
-                    if game_info["player1"].lower() == self.bot_address.lower():
-                        my_pool = game_info["player1Pool"]
-                        opponent_pool = game_info["player2Pool"]
-                    else:
-                        my_pool = game_info["player2Pool"]
-                        opponent_pool = game_info["player1Pool"]
+                    if fields is None:
+                        fields = _PLAYER_FIELDS[game_info["player1"].lower() == self.bot_address_lower]
+                    my_pool = game_info[fields["my_pool"]]
+                    opponent_pool = game_info[fields["opponent_pool"]]
+                    
+                    # With no position to manage, skip market data and the AI while nothing they
+                    # depend on (game and position states, PnL, our pool's reserves) has changed;
+                    # without the reserves (fallback read) the tick can't be compared
+                    tick_sig = (
+                        game_info["state"],
+                        game_info["player1Position"]["state"],
+                        game_info["player2Position"]["state"],
+                        game_info["player1Pnl"],
+                        game_info["player2Pnl"],
+                        snapshot["extra"][0],
+                    ) if snapshot["extra"] else None
+                    if (
+                        tick_sig is not None
+                        and tick_sig == last_sig
+                        and current_position is None
+                        and game_info["gameEndTimestamp"] - now_ts > UNCHANGED_TICK_SKIP_MIN_REMAINING_SECONDS
+                    ):
+                        logger.debug("Game %d unchanged since last decision; skipping tick", game_id)
+                        await self._wait_for_game_event(game_id, game_info["gameEndTimestamp"])
+                        continue
+                    last_sig = tick_sig
                         
                     # Get market data from our pool
                     try:
@@ -555,20 +900,14 @@ class GameManager:
                         continue
                     
                     # Calculate game state
-                    time_elapsed = (datetime.now() - game_start_time).total_seconds()
+                    time_elapsed = (now_dt - game_start_time).total_seconds()
                     time_remaining = max(0, self.config.game_duration_seconds - time_elapsed)
                     
                     # Determine opponent info
-                    if game_info["player1"].lower() == self.bot_address.lower():
-                        opponent_address = game_info["player2"]
-                        opponent_position = game_info["player2Position"]
-                        my_pnl = game_info["player1Pnl"]
-                        opponent_pnl = game_info["player2Pnl"]
-                    else:
-                        opponent_address = game_info["player1"]
-                        opponent_position = game_info["player1Position"]
-                        my_pnl = game_info["player2Pnl"]
-                        opponent_pnl = game_info["player1Pnl"]
+                    opponent_address = game_info[fields["opponent"]]
+                    opponent_position = game_info[fields["opponent_position"]]
+                    my_pnl = game_info[fields["my_pnl"]]
+                    opponent_pnl = game_info[fields["opponent_pnl"]]
                         
                     # Debug logging for PnL values
                     logger.debug(f"Raw PnL values - my_pnl: {my_pnl} ({type(my_pnl)}), opponent_pnl: {opponent_pnl} ({type(opponent_pnl)})")
@@ -582,8 +921,8 @@ class GameManager:
                     # Create game state for AI
                     # Handle PnL values safely - they might be negative or very large
                     try:
-                        opponent_pnl_eth = Web3.from_wei(abs(opponent_pnl), "ether")
-                        my_pnl_eth = Web3.from_wei(abs(my_pnl), "ether")
+                        opponent_pnl_eth = self._wei_to_eth(opponent_pnl)
+                        my_pnl_eth = self._wei_to_eth(my_pnl)
                     except (ValueError, OverflowError) as e:
                         logger.warning(f"PnL conversion error: {e}, using 0")
                         opponent_pnl_eth = 0
@@ -602,9 +941,19 @@ class GameManager:
                     
                     # Get trading decision from Alith AI
                     logger.info(f"\033[94m🤖 Getting AI trading decision...\033[0m")
+                    # Give up on the decision once the auto-close window opens, so it can't starve that path
+                    decision_timeout = None
+                    if game_info["gameEndTimestamp"] > 0:
+                        decision_timeout = max(game_info["gameEndTimestamp"] - AUTO_CLOSE_SECONDS - time.time(), 0.1)
                     try:
-                        decision = self.alith_client.get_trading_decision(market_data, game_state)
+                        decision = await asyncio.wait_for(
+                            self.alith_client.get_trading_decision_async(market_data, game_state),
+                            decision_timeout,
+                        )
                         logger.info(f"\033[93m🎯 AI Decision: {decision.action} - {decision.reasoning}\033[0m")
+                    except asyncio.TimeoutError:
+                        logger.warning(f"\033[33m⏰ AI decision timed out for game {game_id}; re-checking game state\033[0m")
+                        continue
                     except Exception as e:
                         logger.error(f"Failed to get AI decision: {e}")
                         await asyncio.sleep(5)
@@ -618,6 +967,10 @@ class GameManager:
                         await asyncio.sleep(5)
                         continue
                     
+                    # Anything we did changes the state the next decision should see
+                    if success:
+                        last_sig = None
+                    
                     # Update position tracking
                     if success and decision.action == "open_long":
                         current_position = "long"
@@ -635,8 +988,8 @@ class GameManager:
                         position_entry_price = None
                         position_open_time = None
                     
-                    # Sleep for a short interval
-                    await asyncio.sleep(1)
+                    # Wait for a game update from the WebSocket or the next deadline
+                    await self._wait_for_game_event(game_id, game_info["gameEndTimestamp"])
                     
                 except Exception as e:
                     logger.error(f"\033[31m❌ Error in game loop iteration: {e}\033[0m")
@@ -645,11 +998,32 @@ class GameManager:
         except Exception as e:
             logger.error(f"\033[31m❌ Error in game loop for game {game_id}: {e}\033[0m")
         finally:
+            self._game_events.pop(game_id, None)
+            self._last_position_cache.pop(game_id, None)
             logger.info(f"\033[93m🛑 Game loop ended for game {game_id}\033[0m")
             
     async def _get_market_data(self, pool_address: str) -> MarketData:
-        """Get current market data from Uniswap V2 pool."""
-        return await self.price_feed_manager.get_market_data(pool_address)
+        """Get current market data from Uniswap V2 pool.
+
+        Game loops on the same pool share a snapshot for MARKET_DATA_CACHE_TTL_SECONDS,
+        and concurrent misses share one fetch.
+        """
+        cached = self._pool_md_cache.get(pool_address)
+        if cached is not None and time.monotonic() - cached[0] < MARKET_DATA_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        task = self._pool_md_tasks.get(pool_address)
+        if task is None:
+            task = asyncio.create_task(self._fetch_market_data(pool_address))
+            self._pool_md_tasks[pool_address] = task
+            task.add_done_callback(lambda _: self._pool_md_tasks.pop(pool_address, None))
+        return await asyncio.shield(task)
+        
+    async def _fetch_market_data(self, pool_address: str) -> MarketData:
+        """Fetch market data and store it in the cache (see _get_market_data)."""
+        market_data = await self.price_feed_manager.get_market_data(pool_address)
+        self._pool_md_cache[pool_address] = (time.monotonic(), market_data)
+        return market_data
         
     async def _execute_decision(
         self,
@@ -667,23 +1041,24 @@ class GameManager:
             if decision.action in ["open_long", "open_short"] and not current_position:
                 # Open a new position
                 direction = Direction.Long if decision.action == "open_long" else Direction.Short
-                # Ensure nonce is within valid uint256 range
-                nonce = random.randint(1, min(1000000, 2**256 - 1))
+                # The nonce hides our direction in the position commitment, so it must be
+                # unpredictable; 63 bits keeps it positive in the SQLite INTEGER column
+                nonce = secrets.randbits(63) or 1
                 
-                logger.info(f"\033[94m📈 Opening {direction.name} position in game {game_id}\033[0m")
-                logger.info(f"\033[93m🎲 Generated nonce: {nonce}\033[0m")
+                logger.info("\033[94m📈 Opening %s position in game %s\033[0m", direction.name, game_id)
+                logger.info("\033[93m🎲 Generated nonce: %s\033[0m", nonce)
                 
                 # Backend now hashes and signs. We send plaintext (direction, nonce)
                 # Ensure all values are within valid ranges
-                if game_id < 0 or game_id > 2**256 - 1:
-                    logger.error(f"Invalid game_id for hashing: {game_id}")
-                    return
-                if nonce < 0 or nonce > 2**256 - 1:
-                    logger.error(f"Invalid nonce for hashing: {nonce}")
+                if not _is_uint256(game_id):
+                    logger.error("Invalid game_id for hashing: %s", game_id)
                     return
 
+                # The commitment is deterministic, so compute it before the backend round-trip
+                local_hashed_direction = _compute_hashed_direction(game_id, direction, nonce)
+
                 # Get backend signature by sending UNHASHED payload
-                logger.info(f"\033[93m🔐 Getting backend signature for position (unhashed payload)...\033[0m")
+                logger.info("\033[93m🔐 Getting backend signature for position (unhashed payload)...\033[0m")
                 sign_response = await self.backend_client.get_post_position_signature(
                     game_id=game_id,
                     player_address=self.bot_address,
@@ -692,7 +1067,7 @@ class GameManager:
                 )
 
                 if not sign_response:
-                    logger.error(f"\033[31m❌ Failed to get backend signature for position\033[0m")
+                    logger.error("\033[31m❌ Failed to get backend signature for position\033[0m")
                     return
 
                 backend_signature_hex = sign_response.get("backend_signature")
@@ -704,43 +1079,34 @@ class GameManager:
                     return
 
                 # Convert to proper types for contract call
-                backend_signature_bytes = bytes.fromhex(backend_signature_hex.replace("0x", ""))
+                backend_signature_bytes = _hex_to_bytes(backend_signature_hex)
 
-                if not hashed_direction_hex:
-                    logger.warning("Backend response missing hashedDirection; computing locally as fallback")
-                    try:
-                        from eth_abi import encode
-                        encoded_data = encode(['uint256', 'uint8', 'uint256'], [game_id, int(direction), int(nonce)])
-                        hashed_direction = self.web3.keccak(encoded_data)
-                        hashed_direction_hex = hashed_direction.hex()
-                    except Exception as e:
-                        logger.error(f"Failed to compute local hashedDirection fallback: {e}")
-                        return
+                # We always post our own commitment; a hashedDirection echoed by the backend only
+                # has to agree with it, since the signature covers the backend's value and posting
+                # a different one would revert
+                if hashed_direction_hex and _hex_to_bytes(hashed_direction_hex) != local_hashed_direction:
+                    logger.error(
+                        "\033[31m❌ Backend hashedDirection %s does not match local 0x%s; "
+                        "not posting position\033[0m",
+                        hashed_direction_hex, local_hashed_direction.hex(),
+                    )
+                    return
 
-                logger.info(f"\033[92m✅ Got backend signature, ready to post position...\033[0m")
-                logger.info(f"\033[93m📋 Backend signature: {backend_signature_hex[:20]}...\033[0m")
-                logger.info(f"\033[93m🏷️ Hashed direction: {hashed_direction_hex}\033[0m")
+                logger.info("\033[92m✅ Got backend signature, ready to post position...\033[0m")
+                logger.info("\033[93m📋 Backend signature: %s...\033[0m", backend_signature_hex[:20])
+                logger.info("\033[93m🏷️ Hashed direction: 0x%s\033[0m", local_hashed_direction.hex())
                 
                 # Build and send transaction
-                # Ensure game_id is within valid range
-                if game_id < 0 or game_id > 2**256 - 1:
-                    logger.error(f"Invalid game_id: {game_id}")
-                    return
-                    
-                post_position_function = self.contract.functions.postPosition(
+                post_position_function = self._fn_post_position(
                     game_id,
-                    hashed_direction_hex,
+                    local_hashed_direction,
                     backend_signature_bytes
                 )
                 
-                tx_hash, receipt = build_sign_send_transaction(
-                    self.web3,
-                    post_position_function,
-                    self.config.bot_private_key
-                )
+                tx_hash, receipt = await self._send_transaction(post_position_function)
                 
-                logger.info(f"\033[92m✅ Position opened successfully! Transaction: {tx_hash}\033[0m")
-                logger.info(f"\033[93m📋 Gas used: {receipt['gasUsed']}\033[0m")
+                logger.info("\033[92m✅ Position opened successfully! Transaction: %s\033[0m", tx_hash)
+                logger.info("\033[93m📋 Gas used: %s\033[0m", receipt['gasUsed'])
                 
                 # Record position (even without broadcasting)
                 position_record = PositionRecord(
@@ -750,99 +1116,92 @@ class GameManager:
                     opened_at=datetime.now(),
                     reasoning=decision.reasoning
                 )
-                self.db.record_position(position_record)
-                logger.info(f"\033[92m💾 Position recorded in database with nonce: {nonce}\033[0m")
+                self._db_queue.put_nowait(position_record)
+                self._last_position_cache[game_id] = position_record
+                logger.info("\033[92m💾 Position queued for database with nonce: %s\033[0m", nonce)
                 return True
                 
             elif decision.action == "close_position" and current_position:
-                logger.info(f"[TRACE] Entered close_position block with current_position={current_position}, position_open_time={position_open_time}")
-                # Log hold time for debugging (no restrictions)
-                if position_open_time:
+                logger.debug("[TRACE] Entered close_position block with current_position=%s, position_open_time=%s", current_position, position_open_time)
+                # Log hold time for debugging (no restrictions); only read the clock if it's logged
+                if position_open_time and logger.isEnabledFor(logging.DEBUG):
                     hold_time = (datetime.now() - position_open_time).total_seconds()
-                    logger.info(f"[TRACE] Hold time: {hold_time}s (no minimum restriction)")
+                    logger.debug("[TRACE] Hold time: %ss (no minimum restriction)", hold_time)
                 
                 # Close current position
-                direction = Direction.Long if current_position == "long" else Direction.Short
-                logger.info(f"\033[94m🔒 Closing {direction.name} position in game {game_id}\033[0m")
+                direction = _DIR_BY_NAME.get(current_position, Direction.Short)
+                logger.info("\033[94m🔒 Closing %s position in game %s\033[0m", direction.name, game_id)
                 
                 # Get the nonce from the last position record
-                last_position = self.db.get_last_position(game_id)
-                logger.info(f"[TRACE] last_position from DB: {last_position}")
+                last_position = self._get_last_position(game_id)
+                logger.debug("[TRACE] last_position from DB: %s", last_position)
                 nonce = last_position.nonce if last_position else 0
-                logger.info(f"[TRACE] Using nonce for closePosition: {nonce}")
+                logger.debug("[TRACE] Using nonce for closePosition: %s", nonce)
                 
                 # Ensure game_id is within valid range
-                if game_id < 0 or game_id > 2**256 - 1:
-                    logger.error(f"Invalid game_id: {game_id}")
-                    logger.info("[TRACE] Returning early due to invalid game_id.")
+                if not _is_uint256(game_id):
+                    logger.error("Invalid game_id: %s", game_id)
+                    logger.debug("[TRACE] Returning early due to invalid game_id.")
                     return
                 
                 # Ensure nonce is within valid range
-                if nonce < 0 or nonce > 2**256 - 1:
-                    logger.warning(f"Invalid nonce value: {nonce}, using 0")
+                if not _is_uint256(nonce):
+                    logger.warning("Invalid nonce value: %s, using 0", nonce)
                     nonce = 0
                 
-                logger.info("[TRACE] About to send closePosition transaction...")
-                close_position_function = self.contract.functions.closePosition(game_id, direction, nonce)
+                logger.debug("[TRACE] About to send closePosition transaction...")
+                close_position_function = self._fn_close_position(game_id, direction, nonce)
                 
-                tx_hash, receipt = build_sign_send_transaction(
-                    self.web3,
-                    close_position_function,
-                    self.config.bot_private_key
-                )
+                tx_hash, receipt = await self._send_transaction(close_position_function)
                 
-                logger.info(f"\033[92m✅ Position closed successfully! Transaction: {tx_hash}\033[0m")
-                logger.info(f"\033[93m📋 Gas used: {receipt['gasUsed']}\033[0m")
+                logger.info("\033[92m✅ Position closed successfully! Transaction: %s\033[0m", tx_hash)
+                logger.info("\033[93m📋 Gas used: %s\033[0m", receipt['gasUsed'])
                 return True
                 
             else:
-                logger.info(f"\033[33m⏸️  No action taken: {decision.action}\033[0m")
+                logger.info("\033[33m⏸️  No action taken: %s\033[0m", decision.action)
                 return False
         except Exception as e:
-            logger.error(f"\033[31m❌ Error executing decision: {e}\033[0m")
+            logger.error("\033[31m❌ Error executing decision: %s\033[0m", e)
             return False
             
     async def _finish_game(self, game_id: int, current_position: Optional[str]):
         """Finish a game."""
         try:
-            logger.info(f"Finishing game {game_id}")
+            logger.info("Finishing game %s", game_id)
             
             # If we have an open position, we need to provide direction and nonce
             if current_position:
-                direction = Direction.Long if current_position == "long" else Direction.Short
-                last_position = self.db.get_last_position(game_id)
+                direction = _DIR_BY_NAME.get(current_position, Direction.Short)
+                last_position = self._get_last_position(game_id)
                 nonce = last_position.nonce if last_position else 0
             else:
                 direction = Direction.Long  # Default
                 nonce = 0
                 
             # Ensure game_id is within valid range
-            if game_id < 0 or game_id > 2**256 - 1:
-                logger.error(f"Invalid game_id in finish_game: {game_id}")
+            if not _is_uint256(game_id):
+                logger.error("Invalid game_id in finish_game: %s", game_id)
                 return
                 
             # Build and send finish game transaction
             tx_params = {'from': self.bot_address}
             
             # Ensure nonce is within valid range
-            if nonce < 0 or nonce > 2**256 - 1:
-                logger.warning(f"Invalid nonce value: {nonce}, using 0")
+            if not _is_uint256(nonce):
+                logger.warning("Invalid nonce value: %s, using 0", nonce)
                 nonce = 0
             
-            tx_hash, receipt = await asyncio.get_event_loop().run_in_executor(
-                None,
-                build_sign_send_transaction,
-                self.web3,
-                self.contract.functions.finishGame(
+            tx_hash, receipt = await self._send_transaction(
+                self._fn_finish_game(
                     game_id,
                     direction,
                     nonce
                 ),
-                self.config.bot_private_key,
                 tx_params
             )
             
-            logger.info(f"Game finished, tx: {tx_hash}")
+            logger.info("Game finished, tx: %s", tx_hash)
             
         except Exception as e:
-            logger.error(f"Error finishing game {game_id}: {e}")
\ No newline at end of file
+            logger.error("Error finishing game %s: %s", game_id, e)
\ No newline at end of file
@@ -5,51 +5,30 @@ Price feed integration for Uniswap V2 pools.
 import asyncio
 import logging
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from eth_abi import decode
+from eth_utils import function_signature_to_4byte_selector
 from web3 import Web3
 from web3.contract import Contract
 
 from alith_client import MarketData
+from uniswap_v2_abi import UNISWAP_V2_PAIR_ABI
 
 
 logger = logging.getLogger(__name__)
 
+# Number of (price, timestamp) samples kept per pool
+PRICE_HISTORY_CAPACITY = 1000
 
-# Uniswap V2 Pair ABI (minimal)
-UNISWAP_V2_PAIR_ABI = [
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "getReserves",
-        "outputs": [
-            {"name": "_reserve0", "type": "uint112"},
-            {"name": "_reserve1", "type": "uint112"},
-            {"name": "_blockTimestampLast", "type": "uint32"}
-        ],
-        "payable": False,
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "token0",
-        "outputs": [{"name": "", "type": "address"}],
-        "payable": False,
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "token1",
-        "outputs": [{"name": "", "type": "address"}],
-        "payable": False,
-        "stateMutability": "view",
-        "type": "function"
-    }
-]
+# getReserves() selector and return types, for reading reserves inside a Multicall3 batch
+_GET_RESERVES_SELECTOR = function_signature_to_4byte_selector("getReserves()")
+_GET_RESERVES_TYPES = ["uint112", "uint112", "uint32"]
+
+# Prefetched reserves older than this (about one game tick) are ignored
+PREFETCHED_RESERVES_MAX_AGE_SECONDS = 1.0
 
 
 class StableToken:
@@ -78,8 +57,12 @@ class UniswapV2PriceFeed(PriceFeed):
         self.contract = contract  # Main game contract
         self.backend_client = backend_client
         self.pool_contracts: Dict[str, Contract] = {}
-        self.price_history: Dict[str, List[Tuple[float, float]]] = {}  # pool -> [(price, timestamp)]
+        self.price_history: Dict[str, Deque[Tuple[float, float]]] = {}  # pool -> ring buffer of (price, timestamp)
         self.stable_token_cache: Dict[str, int] = {}  # pool -> stable token position
+        # pool -> (monotonic time read, reserve0, reserve1) from a caller's batch
+        self._prefetched_reserves: Dict[str, Tuple[float, int, int]] = {}
+        # Pools whose last backend price request failed, so prices come from the chain
+        self._backend_unavailable: set[str] = set()
         
     def _get_pool_contract(self, pool_address: str) -> Contract:
         """Get or create pool contract instance."""
@@ -90,6 +73,29 @@ class UniswapV2PriceFeed(PriceFeed):
             )
         return self.pool_contracts[pool_address]
         
+    def _record_price(self, pool_address: str, price: float) -> None:
+        """Append a price sample; the bounded deque drops the oldest entry when full."""
+        history = self.price_history.get(pool_address)
+        if history is None:
+            history = self.price_history[pool_address] = deque(maxlen=PRICE_HISTORY_CAPACITY)
+        history.append((price, time.time()))
+        
+    def wants_reserves(self, pool_address: str) -> bool:
+        """Whether the next price for the pool is expected to come from its on-chain reserves."""
+        return not self.backend_client or pool_address in self._backend_unavailable
+        
+    def reserves_call(self, pool_address: str) -> Tuple[str, bytes]:
+        """``(target, calldata)`` for reading the pool's reserves inside a caller's Multicall3 batch."""
+        return Web3.to_checksum_address(pool_address), _GET_RESERVES_SELECTOR
+        
+    def prefetch_reserves(self, pool_address: str, returndata: bytes) -> None:
+        """Store reserves read in a caller's batch; the next price calculation uses them instead of an eth_call."""
+        if not returndata:
+            # No contract at the address; leave the regular read path to report it
+            return
+        reserve0, reserve1, _ = decode(_GET_RESERVES_TYPES, returndata)
+        self._prefetched_reserves[pool_address] = (time.monotonic(), reserve0, reserve1)
+        
     def _get_stable_token(self, pool_address: str) -> int:
         """Get stable token position for pool from contract."""
         if pool_address not in self.stable_token_cache:
@@ -109,8 +115,12 @@ class UniswapV2PriceFeed(PriceFeed):
     def _calculate_price(self, pool_address: str) -> float:
         """Calculate price based on pool reserves and stable token position."""
         try:
-            pool_contract = self._get_pool_contract(pool_address)
-            reserves = pool_contract.functions.getReserves().call()
+            prefetched = self._prefetched_reserves.pop(pool_address, None)
+            if prefetched is not None and time.monotonic() - prefetched[0] <= PREFETCHED_RESERVES_MAX_AGE_SECONDS:
+                reserves = prefetched[1:]
+            else:
+                pool_contract = self._get_pool_contract(pool_address)
+                reserves = pool_contract.functions.getReserves().call()
             reserve0 = reserves[0]
             reserve1 = reserves[1]
             
@@ -141,29 +151,17 @@ class UniswapV2PriceFeed(PriceFeed):
                 price_data = await self.backend_client.get_price_data(pool_address)
                 if price_data and "price" in price_data:
                     price = float(price_data["price"])
-                    # Store in history
-                    if pool_address not in self.price_history:
-                        self.price_history[pool_address] = []
-                    self.price_history[pool_address].append((price, time.time()))
-                    # Keep only last 1000 entries
-                    if len(self.price_history[pool_address]) > 1000:
-                        self.price_history[pool_address] = self.price_history[pool_address][-1000:]
+                    self._record_price(pool_address, price)
+                    self._backend_unavailable.discard(pool_address)
+                    self._prefetched_reserves.pop(pool_address, None)
                     return price
             except Exception as e:
                 logger.debug(f"Could not get price from backend: {e}")
+            self._backend_unavailable.add(pool_address)
                 
-        # Calculate from pool directly
-        price = self._calculate_price(pool_address)
-        
-        # Store in history
-        if pool_address not in self.price_history:
-            self.price_history[pool_address] = []
-        self.price_history[pool_address].append((price, time.time()))
-        
-        # Keep only last 1000 entries
-        if len(self.price_history[pool_address]) > 1000:
-            self.price_history[pool_address] = self.price_history[pool_address][-1000:]
-            
+        # Calculate from pool directly; its eth_calls block, so run them off the event loop
+        price = await asyncio.to_thread(self._calculate_price, pool_address)
+        self._record_price(pool_address, price)
         return price
         
     async def get_price_history(self, pool_address: str, limit: int = 20) -> List[float]:
@@ -173,10 +171,11 @@ class UniswapV2PriceFeed(PriceFeed):
             # Get current price to start history
             await self.get_price(pool_address)
             
-        history = self.price_history.get(pool_address, [])
+        history = self.price_history.get(pool_address, ())
         
-        # Extract just prices (not timestamps)
-        prices = [price for price, _ in history]
+        # Extract just prices (not timestamps), walking only the tail we need
+        prices = [price for price, _ in islice(reversed(history), limit)]
+        prices.reverse()
         
         # If we don't have enough history, pad with the last known price
         if len(prices) < limit:
@@ -192,6 +191,18 @@ class PriceFeedManager:
     def __init__(self, web3: Web3, contract: Contract, backend_client=None):
         self.feed = UniswapV2PriceFeed(web3, contract, backend_client)
         
+    def wants_reserves(self, pool_address: str) -> bool:
+        """Whether batching the pool's reserves read is worthwhile (prices not coming from the backend)."""
+        return self.feed.wants_reserves(pool_address)
+        
+    def reserves_call(self, pool_address: str) -> Tuple[str, bytes]:
+        """``(target, calldata)`` for batching the pool's reserves read with other calls."""
+        return self.feed.reserves_call(pool_address)
+        
+    def prefetch_reserves(self, pool_address: str, returndata: bytes) -> None:
+        """Hand reserves read in a batch to the feed for the next market data request."""
+        self.feed.prefetch_reserves(pool_address, returndata)
+        
     async def get_market_data(self, pool_address: str) -> MarketData:
         """Get current market data for a pool."""
         current_price = await self.feed.get_price(pool_address)
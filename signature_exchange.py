@@ -168,8 +168,10 @@ class RedisSignatureExchange(SignatureExchange):
 class HTTPSignatureExchange(SignatureExchange):
     """HTTP API-based signature exchange."""
     
-    def __init__(self, api_url: str):
+    def __init__(self, api_url: str, session: Optional[aiohttp.ClientSession] = None):
         self.api_url = api_url
+        # Optional shared session (e.g. backend_client.create_http_session()) to reuse connections
+        self.session = session
         
     async def request_signature(
         self,
@@ -180,31 +182,48 @@ class HTTPSignatureExchange(SignatureExchange):
     ) -> Optional[bytes]:
         """Request signature via HTTP API."""
         try:
+            if self.session is not None:
+                return await self._post_signature_request(
+                    self.session, game_id, player1_address, player2_address, signature_expiration
+                )
             async with aiohttp.ClientSession() as session:
-                url = f"{self.api_url}/signature/request"
-                data = {
-                    "game_id": game_id,
-                    "player1_address": player1_address,
-                    "player2_address": player2_address,
-                    "signature_expiration": signature_expiration
-                }
-                
-                async with session.post(url, json=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if result.get("approved"):
-                            return bytes.fromhex(result["signature"])
-                        else:
-                            logger.info("Signature request denied")
-                            return None
-                    else:
-                        logger.error(f"HTTP signature request failed: {response.status}")
-                        return None
+                return await self._post_signature_request(
+                    session, game_id, player1_address, player2_address, signature_expiration
+                )
                         
         except Exception as e:
             logger.error(f"Error in HTTP signature exchange: {e}")
             return None
             
+    async def _post_signature_request(
+        self,
+        session: aiohttp.ClientSession,
+        game_id: int,
+        player1_address: str,
+        player2_address: str,
+        signature_expiration: int
+    ) -> Optional[bytes]:
+        """POST the signature request using the given session."""
+        url = f"{self.api_url}/signature/request"
+        data = {
+            "game_id": game_id,
+            "player1_address": player1_address,
+            "player2_address": player2_address,
+            "signature_expiration": signature_expiration
+        }
+        
+        async with session.post(url, json=data) as response:
+            if response.status == 200:
+                result = await response.json()
+                if result.get("approved"):
+                    return bytes.fromhex(result["signature"])
+                else:
+                    logger.info("Signature request denied")
+                    return None
+            else:
+                logger.error(f"HTTP signature request failed: {response.status}")
+                return None
+            
     async def provide_signature(
         self,
         request: SignatureRequest,
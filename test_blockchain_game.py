@@ -0,0 +1,104 @@
+"""
+Tests for the raw eth_call decoding in blockchain.game.
+
+The read helpers skip ContractFunction and decode with eth_abi directly; these
+check that they still return what the ContractFunction path returned.
+"""
+
+import sys
+from pathlib import Path
+
+from eth_abi import encode
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from blockchain import get_contract, get_game_info, get_player_game_info
+from blockchain.game import _GAME_INFO_TYPES, _PLAYER_GAME_INFO_TYPES
+
+
+CONTRACT_ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+PLAYER1 = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+PLAYER2 = "0xAb5801a7D398351b8bE11C439e05C5B3259aeC9B"
+POOL1 = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+POOL2 = "0xA478c2975Ab1Ea89e8196811F51A7B7Ade33eB11"
+
+GAME = [
+    10**16,
+    PLAYER1,
+    1_700_000_060,
+    POOL1,
+    PLAYER2,
+    POOL2,
+    2,
+    (123_456_789, bytes(range(32)), 1),
+    (0, bytes(32), 0),
+    -5 * 10**15,
+    5 * 10**15,
+]
+
+
+class _StaticCallProvider(BaseProvider):
+    """Answers every eth_call with the same returndata."""
+
+    def __init__(self, returndata: bytes):
+        super().__init__()
+        self._returndata = returndata
+
+    def make_request(self, method, params):
+        result = "0x1" if method == "eth_chainId" else "0x" + self._returndata.hex()
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def _contract(returndata: bytes):
+    return get_contract(Web3(_StaticCallProvider(returndata)), CONTRACT_ADDRESS)
+
+
+def test_game_info_matches_contract_function_call():
+    contract = _contract(encode(_GAME_INFO_TYPES, GAME))
+    old = contract.functions.games(7).call()
+
+    assert get_game_info(contract, 7) == {
+        "betAmount": old[0],
+        "player1": old[1],
+        "gameEndTimestamp": old[2],
+        "player1Pool": old[3],
+        "player2": old[4],
+        "player2Pool": old[5],
+        "state": old[6],
+        "player1Position": {
+            "openingPrice": old[7][0],
+            "hashedDirection": "0x" + bytes(old[7][1]).hex(),
+            "state": old[7][2],
+        },
+        "player2Position": {
+            "openingPrice": old[8][0],
+            "hashedDirection": "0x" + bytes(old[8][1]).hex(),
+            "state": old[8][2],
+        },
+        "player1Pnl": old[9],
+        "player2Pnl": old[10],
+    }
+
+
+def test_game_info_addresses_are_checksummed():
+    info = get_game_info(_contract(encode(_GAME_INFO_TYPES, GAME)), 7)
+
+    assert (info["player1"], info["player1Pool"], info["player2"], info["player2Pool"]) == (
+        PLAYER1, POOL1, PLAYER2, POOL2,
+    )
+
+
+def test_player_game_info_matches_contract_function_call():
+    contract = _contract(encode(_PLAYER_GAME_INFO_TYPES, [True, 7, 2]))
+    old = contract.functions.playerGameInfo(PLAYER1).call()
+
+    assert get_player_game_info(contract, PLAYER1) == {
+        "inGame": old[0],
+        "gameId": old[1],
+        "role": old[2],
+    }
@@ -34,13 +34,13 @@ async def test_backend_client():
         games = await backend_client.get_available_games()
         print(f"Available games: {len(games)}")
         
-        # Test getting join signature (will fail without valid game)
-        print("\n2. Testing get_join_game_signature...")
-        signature = await backend_client.get_join_game_signature(
+        # Test getting position signature (will fail without valid game)
+        print("\n2. Testing get_post_position_signature...")
+        signature = await backend_client.get_post_position_signature(
             game_id=1,
-            player1_address="0x1111111111111111111111111111111111111111",
-            player2_address="0x2222222222222222222222222222222222222222",
-            signature_expiration=1234567890
+            player_address="0x2222222222222222222222222222222222222222",
+            direction=0,
+            nonce=1
         )
         print(f"Signature received: {signature is not None}")
 
@@ -98,7 +98,7 @@ async def test_alith_client():
     
     print("\nGetting trading decision from Alith AI...")
     try:
-        decision = alith_client.get_trading_decision(market_data, game_state)
+        decision = await alith_client.get_trading_decision_async(market_data, game_state)
         print(f"Decision: {decision.action}")
         print(f"Reasoning: {decision.reasoning}")
         print(f"Confidence: {decision.confidence}")
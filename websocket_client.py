@@ -11,6 +11,10 @@ from websockets.exceptions import ConnectionClosed
 
 logger = logging.getLogger(__name__)
 
+# Protocol-level keepalive: a dead connection ends listen() instead of hanging it
+WS_PING_INTERVAL_SECONDS = 20
+WS_PING_TIMEOUT_SECONDS = 10
+
 
 class WebSocketClient:
     """WebSocket client for receiving backend notifications."""
@@ -28,7 +32,9 @@ class WebSocketClient:
         try:
             # Connect without any headers (like frontend)
             self.websocket = await websockets.connect(
-                self.ws_url
+                self.ws_url,
+                ping_interval=WS_PING_INTERVAL_SECONDS,
+                ping_timeout=WS_PING_TIMEOUT_SECONDS,
             )
             logger.info(f"\033[92m🔌 Connected to WebSocket at {self.ws_url}\033[0m")
             # Send JWT token as first message for authentication
@@ -89,7 +95,7 @@ class WebSocketClient:
             else:
                 logger.info(f"\033[95m📨 Received WebSocket message #{self.message_count}: {message_type}\033[0m")
             
-            logger.debug(f"Message data: {data}")
+            logger.debug("Message data: %s", data)
             
             # Call appropriate handler
             if message_type in self.message_handlers: